@@ -1,5 +1,5 @@
 """Core infrastructure module."""
-from app.core.config import settings
+from app.core.config import settings, get_settings
 from app.core.database import get_session, create_db_and_tables, engine
 from app.core.exceptions import (
     AppException,
@@ -12,6 +12,7 @@ from app.core.exceptions import (
 
 __all__ = [
     "settings",
+    "get_settings",
     "get_session",
     "create_db_and_tables",
     "engine",
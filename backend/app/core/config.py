@@ -2,7 +2,10 @@
 Application configuration using Pydantic Settings.
 Follows Single Responsibility Principle - only handles configuration.
 """
-from typing import List
+import json
+import os
+from functools import lru_cache
+from typing import List, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import PostgresDsn, field_validator
 
@@ -29,10 +32,20 @@ class Settings(BaseSettings):
     db_name: str
     db_host: str = "db"
     db_port: int = 5432
+    # Connections for the whole app (all worker processes); each worker's
+    # pool gets an equal share. Keep below Postgres max_connections (100).
+    db_max_connections: int = 60
+    db_pool_recycle_seconds: int = 1800
+    db_pool_timeout: int = 30
+    db_statement_timeout_ms: int = 30000
+
+    # Server (uvicorn worker processes; None = one per CPU)
+    web_workers: Optional[int] = None
 
     # Security
     secret_key: str
     algorithm: str = "HS256"
+    bcrypt_rounds: int = 12
     access_token_expire_minutes: int = 30
     encryption_key: str
 
@@ -46,25 +59,68 @@ class Settings(BaseSettings):
     # Rate Limiting
     rate_limit_per_minute: int = 60
 
+    @property
+    def worker_count(self) -> int:
+        """
+        Worker processes serving the app (1 in debug: reload needs a single worker).
+        
+        Capped at db_max_connections so every worker gets at least one
+        connection without the total going over the budget.
+        """
+        if self.debug:
+            return 1
+        workers = self.web_workers or os.cpu_count() or 1
+        return max(1, min(workers, self.db_max_connections))
+
+    @property
+    def db_pool_size(self) -> int:
+        """Persistent connections per worker: a third of its connection share."""
+        return max(1, self._db_connections_per_worker // 3)
+
+    @property
+    def db_max_overflow(self) -> int:
+        """Burst connections per worker: the rest of its connection share."""
+        return max(0, self._db_connections_per_worker - self.db_pool_size)
+
+    @property
+    def _db_connections_per_worker(self) -> int:
+        return max(1, self.db_max_connections // self.worker_count)
+
     @property
     def database_url(self) -> str:
         """Construct PostgreSQL connection URL."""
         return f"postgresql://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    @property
+    def database_url_async(self) -> str:
+        """Construct PostgreSQL connection URL for the asyncpg driver."""
+        return f"postgresql+asyncpg://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}"
+
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
         """Parse CORS origins from string or list."""
         if isinstance(v, str):
-            # Handle JSON string from .env
-            import json
-            try:
-                return json.loads(v)
-            except json.JSONDecodeError:
-                # Handle comma-separated string
-                return [origin.strip() for origin in v.split(",")]
+            s = v.strip()
+            # JSON list from .env
+            if s.startswith("["):
+                return json.loads(s)
+            # Comma-separated string (no exception path needed)
+            return [origin.strip() for origin in s.split(",") if origin.strip()]
         return v
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings singleton.
+
+    Settings are built once (reads .env and runs validators). Tests can call
+    get_settings.cache_clear() after changing environment variables to get a
+    fresh instance; modules that imported `settings` keep the old one.
+    """
+    return Settings()
+
+
 # Singleton instance
-settings = Settings()
\ No newline at end of file
+settings = get_settings()
\ No newline at end of file
@@ -2,33 +2,73 @@
 Database engine setup and session management.
 Follows Dependency Inversion Principle.
 """
-from sqlmodel import create_engine, Session, SQLModel
-from typing import Generator
+import logging
+from typing import AsyncGenerator
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlmodel import create_engine, SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from app.core.config import settings
 
-# Create engine with connection pooling
-engine = create_engine(
-    settings.database_url,
-    echo=settings.debug,  # Log SQL queries in debug mode
+# Async engine (asyncpg) with connection pooling (tunable via settings / env)
+engine = create_async_engine(
+    settings.database_url_async,
+    echo=False,  # SQL logging goes through the "sqlalchemy.engine" logger (see below)
+    poolclass=AsyncAdaptedQueuePool,
     pool_pre_ping=True,  # Verify connections before using
-    pool_size=10,  # Number of connections to maintain
-    max_overflow=20  # Max additional connections when pool is full
+    pool_size=settings.db_pool_size,  # Number of connections to maintain
+    max_overflow=settings.db_max_overflow,  # Max additional connections when pool is full
+    pool_recycle=settings.db_pool_recycle_seconds,  # Replace connections before Postgres/proxies drop them
+    pool_timeout=settings.db_pool_timeout,  # Seconds to wait for a free connection before failing
+    connect_args={
+        # JIT only adds latency on short CRUD queries; the timeout stops runaway queries holding pool slots
+        "server_settings": {
+            "jit": "off",
+            "statement_timeout": str(settings.db_statement_timeout_ms),
+        }
+    }
+)
+
+# Session factory built once; get_session checks sessions out of it per request
+async_session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+# Sync engine, only for scripts (table creation); requests use the async engine
+sync_engine = create_engine(
+    settings.database_url,
+    pool_pre_ping=True,
+    connect_args={"options": f"-c jit=off -c statement_timeout={settings.db_statement_timeout_ms}"}
 )
 
 
 def create_db_and_tables():
     """Create all database tables. Used for testing and initial setup."""
-    SQLModel.metadata.create_all(engine)
+    SQLModel.metadata.create_all(sync_engine)
+
 
+# SQL query logs come from the "sqlalchemy.engine" logger; its level can be
+# changed at runtime without re-creating the engine
+if settings.debug:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
-def get_session() -> Generator[Session, None, None]:
+
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency injection for database session.
+    Dependency injection for async database session.
+
+    Nothing is committed automatically: callers must `await session.commit()`
+    to persist changes. The session is closed (returning its connection to
+    the pool) when the request finishes.
 
     Usage in FastAPI:
         @app.get("/users")
-        def get_users(session: Session = Depends(get_session)):
+        async def get_users(session: AsyncSession = Depends(get_session)):
+            result = await session.exec(select(UserModel))
             ...
     """
-    with Session(engine) as session:
-        yield session
\ No newline at end of file
+    session = async_session_factory()
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -2,11 +2,20 @@
 Custom application exceptions.
 Follows Single Responsibility Principle.
 """
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Shared read-only details for exceptions raised without any (no dict per raise)
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class AppException(Exception):
-    """Base exception for all application errors."""
+    """
+    Base exception for all application errors.
+
+    `details` is the caller's dict when one is given; otherwise it is a
+    shared read-only empty mapping and must not be mutated.
+    """
 
     def __init__(
             self,
@@ -16,7 +25,7 @@ class AppException(Exception):
     ):
         self.message = message
         self.status_code = status_code
-        self.details = details or {}
+        self.details = details if details is not None else _EMPTY_DETAILS
         super().__init__(self.message)
 
 
@@ -3,17 +3,47 @@ Security utilities for password hashing and verification.
 
 Uses bcrypt via passlib for secure, irreversible password hashing.
 """
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from passlib.context import CryptContext
 
-# Configure password hashing context
-# Using bcrypt with 12 rounds (balance between security and performance)
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=12
+from app.core.config import settings
+
+# Dedicated, bounded pool for bcrypt work. bcrypt releases the GIL inside
+# its C extension, so threads hash in parallel while the event loop stays
+# responsive; the bound keeps a login storm from spawning unlimited threads.
+_BCRYPT_POOL = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
 )
 
 
+@lru_cache(maxsize=1)
+def _get_pwd_context() -> CryptContext:
+    """
+    Build the bcrypt hashing context once.
+
+    Cost factor comes from settings.bcrypt_rounds (default 12, balance between
+    security and performance). Tests can change the setting and call
+    _get_pwd_context.cache_clear() to rebuild the context.
+
+    min_rounds marks hashes weaker than the configured cost as needing an
+    update; max_rounds is bcrypt's own ceiling, so stronger hashes are never
+    downgraded.
+    """
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__rounds=settings.bcrypt_rounds,
+        bcrypt__min_rounds=settings.bcrypt_rounds,
+        bcrypt__max_rounds=31
+    )
+
+
 def hash_password(plain_password: str) -> str:
     """
     Hash a plaintext password using bcrypt.
@@ -34,7 +64,7 @@ def hash_password(plain_password: str) -> str:
         >>> print(hashed)
         '$2b$12$abc...xyz'
     """
-    return pwd_context.hash(plain_password)
+    return _get_pwd_context().hash(plain_password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -60,7 +90,64 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         False
     """
     try:
-        return pwd_context.verify(plain_password, hashed_password)
+        return _get_pwd_context().verify(plain_password, hashed_password)
     except Exception:
         # Invalid hash format or other error
         return False
+
+
+def verify_and_maybe_rehash(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and upgrade its hash if the bcrypt cost is outdated.
+    
+    Use this on login instead of verify_password. The cost factor is
+    embedded in the hash itself ($2b$<cost>$[salt][hash]), so raising
+    settings.bcrypt_rounds lets existing users migrate one login at a time
+    instead of requiring a mass rehash.
+    
+    Args:
+        plain_password: The plaintext password to verify
+        hashed_password: The stored bcrypt hash
+    
+    Returns:
+        Tuple of (is_valid, new_hash). new_hash is None unless the password
+        is valid and the stored hash uses fewer rounds than configured;
+        the caller must persist it (UPDATE users.password_hash).
+    
+    Example:
+        >>> ok, new_hash = verify_and_maybe_rehash("MyPassword", user.password_hash)
+        >>> if ok and new_hash is not None:
+        ...     user.password_hash = new_hash
+    """
+    try:
+        return _get_pwd_context().verify_and_update(plain_password, hashed_password)
+    except Exception:
+        # Invalid hash format or other error
+        return False, None
+
+
+async def ahash_password(plain_password: str) -> str:
+    """
+    Async version of hash_password for use inside async endpoints.
+    
+    Runs the bcrypt work in a dedicated thread pool so it does not block
+    the event loop (each hash takes tens to hundreds of milliseconds).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_BCRYPT_POOL, hash_password, plain_password)
+
+
+async def averify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Async version of verify_password for use inside async endpoints.
+    
+    Runs the bcrypt work in a dedicated thread pool so it does not block
+    the event loop.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _BCRYPT_POOL, verify_password, plain_password, hashed_password
+    )
@@ -4,13 +4,24 @@ Pure business logic for monthly budgets with 50/30/20 rule.
 """
 from dataclasses import dataclass
 from datetime import datetime, date
-from decimal import Decimal
+from decimal import Decimal, Context, ROUND_HALF_EVEN
 from typing import Optional
 
 from app.domain.value_objects.budget_category import BudgetCategory
+from app.domain.services.budget_helpers import get_days_left_in_period
 
+# 50/30/20 shares and rounding constants (built once, not per call)
+_NEEDS = Decimal("0.50")
+_WANTS = Decimal("0.30")
+_SAVINGS = Decimal("0.20")
+_CENT = Decimal("0.01")
+_ZERO = Decimal("0.00")
+_HUNDRED = Decimal(100)
+# Explicit rounding context (same as decimal default) so quantize skips the thread-local lookup
+_CTX = Context(prec=28, rounding=ROUND_HALF_EVEN)
 
-@dataclass
+
+@dataclass(slots=True)
 class Budget:
     """
     Budget domain entity representing monthly financial plan.
@@ -45,9 +56,9 @@ class Budget:
             >>> budget.calculate_50_30_20()
             (Decimal('15000.00'), Decimal('9000.00'), Decimal('6000.00'))
         """
-        needs = (self.monthly_income * Decimal('0.50')).quantize(Decimal('0.01'))
-        wants = (self.monthly_income * Decimal('0.30')).quantize(Decimal('0.01'))
-        savings = (self.monthly_income * Decimal('0.20')).quantize(Decimal('0.01'))
+        needs = (self.monthly_income * _NEEDS).quantize(_CENT, context=_CTX)
+        wants = (self.monthly_income * _WANTS).quantize(_CENT, context=_CTX)
+        savings = (self.monthly_income * _SAVINGS).quantize(_CENT, context=_CTX)
         return (needs, wants, savings)
     
     def get_allocated_for_category(self, category: BudgetCategory) -> Decimal:
@@ -89,7 +100,7 @@ class Budget:
         """
         allocated = self.get_allocated_for_category(category)
         remaining = allocated - total_spent
-        return remaining.quantize(Decimal('0.01'))
+        return remaining.quantize(_CENT, context=_CTX)
     
     def get_safe_to_spend(
         self,
@@ -125,25 +136,24 @@ class Budget:
         
         # If period ended, no more spending allowed
         if current_date > self.period_end_date:
-            return Decimal('0.00')
+            return _ZERO
         
         # Calculate remaining budget
         remaining = self.get_remaining_budget(category, total_spent)
         
         # If overspent or no budget left, return 0
         if remaining <= 0:
-            return Decimal('0.00')
+            return _ZERO
         
         # Calculate days left (including today)
-        from app.domain.services.budget_helpers import get_days_left_in_period
         days_left = get_days_left_in_period(self.period_end_date, current_date)
         
         # Avoid division by zero
         if days_left <= 0:
-            return Decimal('0.00')
+            return _ZERO
         
         # Safe daily amount
-        safe_daily = (remaining / days_left).quantize(Decimal('0.01'))
+        safe_daily = (remaining / days_left).quantize(_CENT, context=_CTX)
         return safe_daily
     
     def is_overspent(self, category: BudgetCategory, total_spent: Decimal) -> bool:
@@ -196,9 +206,9 @@ class Budget:
         allocated = self.get_allocated_for_category(category)
         
         if allocated == 0:
-            return Decimal('0.00')
+            return _ZERO
         
-        percentage = (total_spent / allocated * 100).quantize(Decimal('0.01'))
+        percentage = (total_spent / allocated * _HUNDRED).quantize(_CENT, context=_CTX)
         return percentage
     
     def get_days_in_period(self) -> int:
@@ -5,14 +5,15 @@ Pure business logic, framework-independent.
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
 from app.domain.value_objects.budget_category import BudgetCategory
 from app.domain.value_objects.transaction_type import TransactionType
 from app.domain.value_objects.transaction_source import TransactionSource
+from app.shared.helpers import utc_now
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     """
     Transaction domain entity representing financial transaction.
@@ -30,8 +31,30 @@ class Transaction:
     source: TransactionSource
     is_ai_categorized: bool = False
     mono_transaction_id: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
     deleted_at: Optional[datetime] = None
+    # Type/source flags for hot aggregation loops, kept in sync by __setattr__
+    _is_income: bool = field(init=False, repr=False, compare=False)
+    _is_expense: bool = field(init=False, repr=False, compare=False)
+    _is_bank: bool = field(init=False, repr=False, compare=False)
+    _is_manual: bool = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        """
+        Coerce transaction_type/source to enum members and refresh their flags.
+        
+        Runs for the assignments in __init__ as well as later ones, so the
+        flags can never go stale.
+        """
+        if name == "transaction_type":
+            value = TransactionType(value)
+            object.__setattr__(self, "_is_income", value is TransactionType.INCOME)
+            object.__setattr__(self, "_is_expense", value is TransactionType.EXPENSE)
+        elif name == "source":
+            value = TransactionSource(value)
+            object.__setattr__(self, "_is_bank", value is TransactionSource.MONOBANK)
+            object.__setattr__(self, "_is_manual", value is TransactionSource.MANUAL)
+        object.__setattr__(self, name, value)
     
     def is_income(self) -> bool:
         """
@@ -40,7 +63,7 @@ class Transaction:
         Returns:
             True if transaction type is INCOME
         """
-        return self.transaction_type == TransactionType.INCOME
+        return self._is_income
     
     def is_expense(self) -> bool:
         """
@@ -49,7 +72,7 @@ class Transaction:
         Returns:
             True if transaction type is EXPENSE
         """
-        return self.transaction_type == TransactionType.EXPENSE
+        return self._is_expense
     
     def is_from_bank(self) -> bool:
         """
@@ -58,7 +81,7 @@ class Transaction:
         Returns:
             True if source is MONOBANK
         """
-        return self.source == TransactionSource.MONOBANK
+        return self._is_bank
     
     def is_manual(self) -> bool:
         """
@@ -67,7 +90,7 @@ class Transaction:
         Returns:
             True if source is MANUAL
         """
-        return self.source == TransactionSource.MANUAL
+        return self._is_manual
     
     def soft_delete(self) -> None:
         """
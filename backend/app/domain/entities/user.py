@@ -7,9 +7,10 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from app.domain.value_objects.tracking_mode import TrackingMode
+from app.shared.helpers import utc_now
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """
     User domain entity representing core business logic.
@@ -25,8 +26,8 @@ class User:
     mono_token: Optional[str] = None
     mono_account_id: Optional[str] = None
     webhook_hash: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = field(default_factory=utc_now)
+    updated_at: datetime = field(default_factory=utc_now)
     
     def can_use_ai_advisor(self) -> bool:
         """
@@ -45,7 +46,7 @@ class User:
             True if user has valid Monobank token configured
         """
         return (
-            self.tracking_mode == TrackingMode.AUTO_MONO 
+            self.tracking_mode is TrackingMode.AUTO_MONO
             and self.mono_token is not None
         )
     
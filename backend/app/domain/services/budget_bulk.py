@@ -0,0 +1,71 @@
+"""
+Vectorized 50/30/20 rollups for many budgets at once.
+
+The Budget entity works with Decimal and is the right tool for a single
+budget. Dashboards that aggregate hundreds or thousands of budgets use
+these NumPy helpers instead: one array operation per step instead of a
+Python-level Decimal loop per row. Values are float64 internally, so
+round to cents only at the reporting boundary (see to_decimals).
+"""
+from decimal import Decimal
+from typing import Iterable, List
+
+import numpy as np
+
+# NEEDS / WANTS / SAVINGS shares, in that column order
+_SHARES = np.array([0.50, 0.30, 0.20], dtype=np.float64)
+_CENT = Decimal("0.01")
+
+
+def bulk_rollup(
+    incomes: np.ndarray,
+    spent: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute 50/30/20 allocations, remainders and progress for N budgets.
+    
+    Args:
+        incomes: Monthly incomes, shape (N,)
+        spent: Amount spent per category, shape (N, 3) in
+               NEEDS / WANTS / SAVINGS column order
+        
+    Returns:
+        Tuple of (allocated, remaining, progress_pct), each float64 of
+        shape (N, 3). Remaining can be negative if overspent; progress is
+        0 where nothing is allocated (same rules as Budget).
+        
+    Example:
+        >>> allocated, remaining, pct = bulk_rollup(
+        ...     np.array([30000.0]), np.array([[3000.0, 0.0, 0.0]])
+        ... )
+        >>> remaining[0]
+        array([12000.,  9000.,  6000.])
+    """
+    incomes = np.asarray(incomes, dtype=np.float64)
+    spent = np.asarray(spent, dtype=np.float64)
+    if spent.shape != (incomes.shape[0], 3):
+        raise ValueError(
+            f"spent must have shape ({incomes.shape[0]}, 3), got {spent.shape}"
+        )
+    
+    allocated = np.multiply(incomes[:, None], _SHARES)
+    remaining = allocated - spent
+    
+    progress = np.zeros_like(allocated)
+    np.divide(spent, allocated, out=progress, where=allocated != 0)
+    progress *= 100
+    
+    return allocated, remaining, progress
+
+
+def to_decimals(values: Iterable[float]) -> List[Decimal]:
+    """
+    Convert float results to Decimal rounded to cents, for display/reporting.
+    
+    Args:
+        values: One row (or any 1-D sequence) of bulk_rollup output
+        
+    Returns:
+        List of Decimal values quantized to 0.01
+    """
+    return [Decimal(repr(float(v))).quantize(_CENT) for v in values]
@@ -3,6 +3,13 @@ Budget helper functions for period calculation and date math.
 """
 from datetime import date
 from calendar import monthrange
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _last_day(year: int, month: int) -> int:
+    """Number of days in month (memoized)."""
+    return monthrange(year, month)[1]
 
 
 def get_month_period(year: int, month: int) -> tuple[date, date]:
@@ -20,10 +27,7 @@ def get_month_period(year: int, month: int) -> tuple[date, date]:
         >>> get_month_period(2026, 1)
         (date(2026, 1, 1), date(2026, 1, 31))
     """
-    start_date = date(year, month, 1)
-    last_day = monthrange(year, month)[1]
-    end_date = date(year, month, last_day)
-    return (start_date, end_date)
+    return (date(year, month, 1), date(year, month, _last_day(year, month)))
 
 
 def get_current_month_period() -> tuple[date, date]:
@@ -39,7 +43,7 @@ def get_current_month_period() -> tuple[date, date]:
         (date(2026, 1, 1), date(2026, 1, 31))
     """
     today = date.today()
-    return get_month_period(today.year, today.month)
+    return (today.replace(day=1), today.replace(day=_last_day(today.year, today.month)))
 
 
 def get_days_left_in_period(end_date: date, current_date: date | None = None) -> int:
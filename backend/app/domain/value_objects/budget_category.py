@@ -23,15 +23,25 @@ class BudgetCategory(str, Enum):
     WANTS = "WANTS"
     SAVINGS = "SAVINGS"
     
+    # Set once per member after the class (see bottom)
+    _pct: int
+    _is_essential: bool
+    
     def is_essential(self) -> bool:
         """Check if category is essential (NEEDS)."""
-        return self == BudgetCategory.NEEDS
+        return self._is_essential
     
     def get_budget_percentage(self) -> int:
         """Get recommended budget percentage for this category."""
-        percentages = {
-            BudgetCategory.NEEDS: 50,
-            BudgetCategory.WANTS: 30,
-            BudgetCategory.SAVINGS: 20
-        }
-        return percentages[self]
+        return self._pct
+
+
+# Recommended percentage per category, attached to members at import
+for _category, _pct in (
+    (BudgetCategory.NEEDS, 50),
+    (BudgetCategory.WANTS, 30),
+    (BudgetCategory.SAVINGS, 20),
+):
+    object.__setattr__(_category, "_pct", _pct)
+    object.__setattr__(_category, "_is_essential", _category is BudgetCategory.NEEDS)
+del _category, _pct
@@ -4,7 +4,8 @@ Category Value Object - Specific transaction categories with budget type mapping
 Each category automatically maps to NEEDS/WANTS/SAVINGS for 50/30/20 rule.
 """
 from enum import Enum
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Optional, Tuple
 
 
 class BudgetType(str, Enum):
@@ -47,6 +48,11 @@ class Category(str, Enum):
     INCOME = "INCOME"
     OTHER = "OTHER"
     
+    # Resolved once per member from _CATEGORY_METADATA at import (see bottom)
+    _budget_type: Optional[BudgetType]
+    display_name_ua: str  # Ukrainian display name
+    icon: str  # SF Symbol icon name
+    
     def get_budget_type(self) -> Optional[BudgetType]:
         """
         Get the budget type (NEEDS/WANTS/SAVINGS) for this category.
@@ -55,138 +61,165 @@ class Category(str, Enum):
             BudgetType: The budget type this category belongs to
             None: For INCOME category (doesn't belong to any budget)
         """
-        # Use string value as key
-        metadata = _CATEGORY_METADATA.get(self.value)
-        return metadata["budget_type"] if metadata else None
-    
-    @property
-    def display_name_ua(self) -> str:
-        """Get Ukrainian display name."""
-        metadata = _CATEGORY_METADATA.get(self.value)
-        return metadata["display_name_ua"] if metadata else self.value
-    
-    @property
-    def icon(self) -> str:
-        """Get SF Symbol icon name."""
-        metadata = _CATEGORY_METADATA.get(self.value)
-        return metadata["icon"] if metadata else "questionmark.circle"
+        return self._budget_type
+    
+    def is_needs(self) -> bool:
+        """Check if this category counts toward the NEEDS budget."""
+        return self._budget_type is BudgetType.NEEDS
+    
+    def is_wants(self) -> bool:
+        """Check if this category counts toward the WANTS budget."""
+        return self._budget_type is BudgetType.WANTS
+    
+    def is_savings(self) -> bool:
+        """Check if this category counts toward the SAVINGS budget."""
+        return self._budget_type is BudgetType.SAVINGS
+    
+    @classmethod
+    def get_set_by_budget_type(cls, budget_type: BudgetType) -> FrozenSet["Category"]:
+        """
+        Get categories of a budget type as a frozenset (precomputed).
+        
+        Use for membership checks in filtering loops (O(1) `in`);
+        get_all_by_budget_type keeps definition order.
+        """
+        return _SET_BY_BUDGET_TYPE.get(budget_type, frozenset())
     
     @classmethod
-    def get_all_by_budget_type(cls, budget_type: BudgetType) -> List["Category"]:
-        """Get all categories that belong to a specific budget type."""
-        return [
-            category for category in cls
-            if category.get_budget_type() == budget_type
-        ]
+    def get_all_by_budget_type(cls, budget_type: BudgetType) -> Tuple["Category", ...]:
+        """Get all categories that belong to a specific budget type (precomputed, immutable)."""
+        return _BY_BUDGET_TYPE.get(budget_type, ())
     
     @classmethod
-    def get_needs_categories(cls) -> List["Category"]:
+    def get_needs_categories(cls) -> Tuple["Category", ...]:
         """Get all NEEDS categories (50% budget)."""
         return cls.get_all_by_budget_type(BudgetType.NEEDS)
     
     @classmethod
-    def get_wants_categories(cls) -> List["Category"]:
+    def get_wants_categories(cls) -> Tuple["Category", ...]:
         """Get all WANTS categories (30% budget)."""
         return cls.get_all_by_budget_type(BudgetType.WANTS)
     
     @classmethod
-    def get_savings_categories(cls) -> List["Category"]:
+    def get_savings_categories(cls) -> Tuple["Category", ...]:
         """Get all SAVINGS categories (20% budget)."""
         return cls.get_all_by_budget_type(BudgetType.SAVINGS)
 
 
-# Metadata defined AFTER enum to avoid circular reference
-_CATEGORY_METADATA = {
+# Metadata defined AFTER enum to avoid circular reference.
+# Keyed by member (no .value load), read-only once built.
+_CATEGORY_METADATA = MappingProxyType({
     # NEEDS (50%)
-    "HOUSING": {
+    Category.HOUSING: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Житло",
         "icon": "house.fill"
     },
-    "UTILITIES": {
+    Category.UTILITIES: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Комунальні",
         "icon": "bolt.fill"
     },
-    "GROCERIES": {
+    Category.GROCERIES: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Продукти",
         "icon": "cart.fill"
     },
-    "TRANSPORT": {
+    Category.TRANSPORT: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Транспорт",
         "icon": "car.fill"
     },
-    "INSURANCE": {
+    Category.INSURANCE: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Страхування",
         "icon": "shield.fill"
     },
-    "HEALTHCARE": {
+    Category.HEALTHCARE: {
         "budget_type": BudgetType.NEEDS,
         "display_name_ua": "Здоров'я",
         "icon": "cross.case.fill"
     },
     
     # WANTS (30%)
-    "ENTERTAINMENT": {
+    Category.ENTERTAINMENT: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Розваги",
         "icon": "tv.fill"
     },
-    "RESTAURANTS": {
+    Category.RESTAURANTS: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Ресторани",
         "icon": "fork.knife"
     },
-    "SHOPPING": {
+    Category.SHOPPING: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Шопінг",
         "icon": "bag.fill"
     },
-    "HOBBIES": {
+    Category.HOBBIES: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Хобі",
         "icon": "sportscourt.fill"
     },
-    "TRAVEL": {
+    Category.TRAVEL: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Подорожі",
         "icon": "airplane"
     },
-    "BEAUTY": {
+    Category.BEAUTY: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Краса",
         "icon": "sparkles"
     },
     
     # SAVINGS (20%)
-    "SAVINGS_ACCOUNT": {
+    Category.SAVINGS_ACCOUNT: {
         "budget_type": BudgetType.SAVINGS,
         "display_name_ua": "Заощадження",
         "icon": "banknote.fill"
     },
-    "INVESTMENTS": {
+    Category.INVESTMENTS: {
         "budget_type": BudgetType.SAVINGS,
         "display_name_ua": "Інвестиції",
         "icon": "chart.line.uptrend.xyaxis"
     },
-    "DEBT_REPAYMENT": {
+    Category.DEBT_REPAYMENT: {
         "budget_type": BudgetType.SAVINGS,
         "display_name_ua": "Погашення боргів",
         "icon": "creditcard.fill"
     },
     
     # SPECIAL
-    "INCOME": {
+    Category.INCOME: {
         "budget_type": None,
         "display_name_ua": "Дохід",
         "icon": "arrow.down.circle.fill"
     },
-    "OTHER": {
+    Category.OTHER: {
         "budget_type": BudgetType.WANTS,
         "display_name_ua": "Інше",
         "icon": "questionmark.circle.fill"
     },
+})
+
+# Attach metadata to members so accessors are plain attribute loads
+# (KeyError at import if a category is missing from the metadata),
+# and build the budget type -> categories reverse index in the same pass
+_by_budget_type: Dict[BudgetType, List[Category]] = {}
+for _category in Category:
+    _metadata = _CATEGORY_METADATA[_category]
+    object.__setattr__(_category, "_budget_type", _metadata["budget_type"])
+    object.__setattr__(_category, "display_name_ua", _metadata["display_name_ua"])
+    object.__setattr__(_category, "icon", _metadata["icon"])
+    if _metadata["budget_type"] is not None:
+        _by_budget_type.setdefault(_metadata["budget_type"], []).append(_category)
+del _category, _metadata
+
+_BY_BUDGET_TYPE: Dict[BudgetType, Tuple[Category, ...]] = {
+    budget_type: tuple(categories) for budget_type, categories in _by_budget_type.items()
+}
+_SET_BY_BUDGET_TYPE: Dict[BudgetType, FrozenSet[Category]] = {
+    budget_type: frozenset(categories) for budget_type, categories in _by_budget_type.items()
 }
+del _by_budget_type
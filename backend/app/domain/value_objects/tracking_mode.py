@@ -18,8 +18,8 @@ class TrackingMode(str, Enum):
     
     def is_auto(self) -> bool:
         """Check if tracking mode is automatic."""
-        return self == TrackingMode.AUTO_MONO
+        return self is TrackingMode.AUTO_MONO
     
     def requires_bank_token(self) -> bool:
         """Check if mode requires Monobank token."""
-        return self == TrackingMode.AUTO_MONO
+        return self is TrackingMode.AUTO_MONO
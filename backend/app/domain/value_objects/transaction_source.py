@@ -18,8 +18,8 @@ class TransactionSource(str, Enum):
     
     def is_manual(self) -> bool:
         """Check if transaction was manually added."""
-        return self == TransactionSource.MANUAL
+        return self is TransactionSource.MANUAL
     
     def is_from_bank(self) -> bool:
         """Check if transaction came from Monobank."""
-        return self == TransactionSource.MONOBANK
+        return self is TransactionSource.MONOBANK
@@ -18,8 +18,8 @@ class TransactionType(str, Enum):
     
     def is_income(self) -> bool:
         """Check if this is an income type."""
-        return self == TransactionType.INCOME
+        return self is TransactionType.INCOME
     
     def is_expense(self) -> bool:
         """Check if this is an expense type."""
-        return self == TransactionType.EXPENSE
+        return self is TransactionType.EXPENSE
@@ -1,20 +1,28 @@
 """Persistence layer models (SQLModel ORM)."""
+from sqlalchemy.orm import configure_mappers
 
 from app.infrastructure.persistence.user_model import UserModel, TrackingModeEnum
 from app.infrastructure.persistence.transaction_model import (
     TransactionModel,
+    TransactionRead,
     TransactionTypeEnum,
     TransactionSourceEnum,
-    BudgetCategoryEnum
+    BudgetCategoryEnum,
+    validate_transactions
 )
 from app.infrastructure.persistence.budget_model import BudgetModel
 
+# Resolve relationships once at import instead of lazily on first query
+configure_mappers()
+
 __all__ = [
     "UserModel",
     "TrackingModeEnum",
     "TransactionModel",
+    "TransactionRead",
     "TransactionTypeEnum",
     "TransactionSourceEnum",
     "BudgetCategoryEnum",
+    "validate_transactions",
     "BudgetModel"
 ]
\ No newline at end of file
@@ -3,14 +3,17 @@ SQLModel Budget - ORM model for database.
 Separate from domain entity (Dependency Inversion Principle).
 """
 from decimal import Decimal
-from datetime import datetime, timezone, date
-from typing import Optional, TYPE_CHECKING
+from datetime import datetime, date
+from typing import Optional
 from sqlmodel import SQLModel, Field, Column, Relationship
-from sqlalchemy import Numeric, Date, DateTime, ForeignKey, UniqueConstraint
-from pydantic import field_validator, model_validator
+from sqlalchemy import Date, DateTime, ForeignKey, UniqueConstraint
+from pydantic import ConfigDict, field_validator, model_validator
 
-if TYPE_CHECKING:
-    from app.infrastructure.persistence.user_model import UserModel
+from app.infrastructure.persistence.types import Cents
+from app.shared.helpers import utc_now
+
+# Max allowed rounding difference between allocations and income (1 UAH)
+_TOLERANCE = Decimal("1.00")
 
 
 class BudgetModel(SQLModel, table=True):
@@ -27,6 +30,19 @@ class BudgetModel(SQLModel, table=True):
         UniqueConstraint('user_id', 'period_start_date', name='uq_user_period'),
     )
 
+    # Pydantic config
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "user_id": 1,
+            "monthly_income": "30000.00",
+            "needs_allocated": "15000.00",
+            "wants_allocated": "9000.00",
+            "savings_allocated": "6000.00",
+            "period_start_date": "2026-01-01",
+            "period_end_date": "2026-01-31"
+        }
+    })
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -42,21 +58,21 @@ class BudgetModel(SQLModel, table=True):
 
     # Income (base for calculations)
     monthly_income: Decimal = Field(
-        sa_column=Column(Numeric(precision=10, scale=2), nullable=False),
+        sa_column=Column(Cents(), nullable=False),
         description="Monthly income amount (base for 50/30/20 calculation)"
     )
 
     # Allocated amounts (50/30/20 rule)
     needs_allocated: Decimal = Field(
-        sa_column=Column(Numeric(precision=10, scale=2), nullable=False),
+        sa_column=Column(Cents(), nullable=False),
         description="50% allocated to NEEDS (essentials)"
     )
     wants_allocated: Decimal = Field(
-        sa_column=Column(Numeric(precision=10, scale=2), nullable=False),
+        sa_column=Column(Cents(), nullable=False),
         description="30% allocated to WANTS (non-essentials)"
     )
     savings_allocated: Decimal = Field(
-        sa_column=Column(Numeric(precision=10, scale=2), nullable=False),
+        sa_column=Column(Cents(), nullable=False),
         description="20% allocated to SAVINGS (future)"
     )
 
@@ -72,7 +88,7 @@ class BudgetModel(SQLModel, table=True):
 
     # Timestamp
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         sa_column=Column(DateTime(timezone=True), nullable=False),
         description="Budget creation timestamp"
     )
@@ -119,7 +135,7 @@ class BudgetModel(SQLModel, table=True):
         
         # Allow 1 UAH difference for rounding
         difference = abs(total_allocated - self.monthly_income)
-        if difference > Decimal('1.00'):
+        if difference > _TOLERANCE:
             raise ValueError(
                 f"Allocated amounts must sum to monthly income. "
                 f"Expected: {self.monthly_income}, Got: {total_allocated}"
@@ -127,21 +143,13 @@ class BudgetModel(SQLModel, table=True):
         
         return self
 
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
-            "example": {
-                "user_id": 1,
-                "monthly_income": "30000.00",
-                "needs_allocated": "15000.00",
-                "wants_allocated": "9000.00",
-                "savings_allocated": "6000.00",
-                "period_start_date": "2026-01-01",
-                "period_end_date": "2026-01-31"
-            }
-        }
-
     def __repr__(self) -> str:
         """String representation."""
-        period = f"{self.period_start_date.strftime('%Y-%m')}"
+        d = self.period_start_date
+        period = f"{d.year:04d}-{d.month:02d}"
         return f"BudgetModel(id={self.id}, income={self.monthly_income}, period={period})"
+
+
+# Related models imported after the class (not under TYPE_CHECKING) so each
+# module registers its relationship targets without a circular import
+from app.infrastructure.persistence.user_model import UserModel  # noqa: E402
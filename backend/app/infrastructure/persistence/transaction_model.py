@@ -2,16 +2,35 @@
 SQLModel Transaction - ORM model for database.
 Separate from domain entity (Dependency Inversion Principle).
 """
+import sys
+from contextvars import ContextVar
 from decimal import Decimal
-from datetime import datetime, timezone
-from typing import Optional, TYPE_CHECKING
+from datetime import datetime, timezone, timedelta
+from time import monotonic
+from typing import Any, Iterable, List, Optional, Tuple
 from sqlmodel import SQLModel, Field, Column, Relationship
-from sqlalchemy import Numeric, String, Enum as SQLEnum, DateTime, ForeignKey, CheckConstraint
-from pydantic import field_validator
+from sqlalchemy import String, DateTime, ForeignKey, CheckConstraint, Index, desc, text
+from pydantic import BaseModel, ConfigDict, model_validator
 import enum
 
-if TYPE_CHECKING:
-    from app.infrastructure.persistence.user_model import UserModel
+from app.infrastructure.persistence.types import Cents, EnumString, InternedString, enum_check
+from app.shared.helpers import utc_now
+
+# "now" for the future-date check is reused for up to 1s per context, so bulk
+# inserts (Monobank sync) read the clock once per batch instead of once per row.
+# Not used for created_at: stamps must follow the real clock to keep ordering.
+_NOW_TTL = timedelta(seconds=1)
+_now_cache: ContextVar[Optional[Tuple[datetime, float]]] = ContextVar("_now_cache", default=None)
+
+
+def _cached_now() -> datetime:
+    """Current UTC time, cached per context for up to _NOW_TTL."""
+    cached = _now_cache.get()
+    tick = monotonic()
+    if cached is None or tick - cached[1] > _NOW_TTL.total_seconds():
+        cached = (datetime.now(timezone.utc), tick)
+        _now_cache.set(cached)
+    return cached[0]
 
 
 class TransactionTypeEnum(str, enum.Enum):
@@ -42,11 +61,44 @@ class TransactionModel(SQLModel, table=True):
     """
     __tablename__ = "transactions"
     
-    # Add constraint at table level
+    # Add constraints at table level (enum columns are plain strings + CHECK)
     __table_args__ = (
         CheckConstraint('amount != 0', name='check_amount_not_zero'),
+        enum_check('category', BudgetCategoryEnum, name='check_category_valid'),
+        enum_check('transaction_type', TransactionTypeEnum, name='check_transaction_type_valid'),
+        enum_check('source', TransactionSourceEnum, name='check_source_valid'),
+        # "User's active transactions, newest first" in a single ordered index walk
+        Index(
+            'ix_tx_user_created_active',
+            'user_id',
+            desc('created_at'),
+            postgresql_where=text('deleted_at IS NULL'),
+            sqlite_where=text('deleted_at IS NULL')
+        ),
+        # Monobank dedup: only synced rows have an ID, so index just those
+        Index(
+            'ix_tx_mono_transaction_id',
+            'mono_transaction_id',
+            unique=True,
+            postgresql_where=text('mono_transaction_id IS NOT NULL'),
+            sqlite_where=text('mono_transaction_id IS NOT NULL')
+        ),
     )
 
+    # Pydantic config
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "user_id": 1,
+            "amount": "-150.50",
+            "currency": "UAH",
+            "description": "Groceries at ATB",
+            "category": "NEEDS",
+            "transaction_type": "EXPENSE",
+            "source": "MANUAL",
+            "is_ai_categorized": False
+        }
+    })
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -62,13 +114,13 @@ class TransactionModel(SQLModel, table=True):
 
     # Transaction Details
     amount: Decimal = Field(
-        sa_column=Column(Numeric(precision=10, scale=2), nullable=False),
+        sa_column=Column(Cents(), nullable=False),
         description="Amount (positive for income, negative for expense)"
     )
     
     currency: str = Field(
         default="UAH",
-        sa_column=Column(String(3), nullable=False),
+        sa_column=Column(InternedString(3), nullable=False),
         min_length=3,
         max_length=3,
         description="Currency code (ISO 4217)"
@@ -83,19 +135,19 @@ class TransactionModel(SQLModel, table=True):
 
     # Categorization
     category: BudgetCategoryEnum = Field(
-        sa_column=Column(SQLEnum(BudgetCategoryEnum), nullable=False),
+        sa_column=Column(EnumString(BudgetCategoryEnum), nullable=False),
         description="Budget category (NEEDS/WANTS/SAVINGS)"
     )
     
     transaction_type: TransactionTypeEnum = Field(
-        sa_column=Column(SQLEnum(TransactionTypeEnum), nullable=False),
+        sa_column=Column(EnumString(TransactionTypeEnum), nullable=False),
         description="Income or Expense"
     )
     
     source: TransactionSourceEnum = Field(
         default=TransactionSourceEnum.MANUAL,
         sa_column=Column(
-            SQLEnum(TransactionSourceEnum),
+            EnumString(TransactionSourceEnum),
             nullable=False,
             server_default=TransactionSourceEnum.MANUAL.value
         ),
@@ -110,15 +162,15 @@ class TransactionModel(SQLModel, table=True):
     # Monobank Integration
     mono_transaction_id: Optional[str] = Field(
         default=None,
-        sa_column=Column(String(100), unique=True, nullable=True),
+        sa_column=Column(String(100), nullable=True),
         max_length=100,
         description="Monobank transaction ID for deduplication"
     )
 
     # Timestamps (timezone-aware)
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        sa_column=Column(DateTime(timezone=True), nullable=False, index=True),
+        default_factory=utc_now,
+        sa_column=Column(DateTime(timezone=True), nullable=False),
         description="Transaction date"
     )
 
@@ -132,55 +184,83 @@ class TransactionModel(SQLModel, table=True):
     # Relationship
     user: Optional["UserModel"] = Relationship(back_populates="transactions")
 
-    # Pydantic Validators
-    @field_validator('amount')
-    @classmethod
-    def validate_amount(cls, v: Decimal) -> Decimal:
-        """Validate amount is not zero."""
-        if v == 0:
+    # Pydantic Validators (fused into one pass per row for bulk inserts)
+    @model_validator(mode='after')
+    def validate_fields(self):
+        """
+        Validate and normalize fields in a single pass.
+        
+        - amount is not zero
+        - description is not empty (whitespace stripped)
+        - currency is not empty (normalized to uppercase)
+        - created_at is not in the future
+        """
+        if self.amount == 0:
             raise ValueError("Amount cannot be zero")
-        return v
-
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        """Validate description is not empty."""
-        if not v or v.strip() == "":
+        
+        # Normalized values are written to __dict__ directly: during validation
+        # the SQLAlchemy instance state is not attached yet, so setattr fails
+        description = self.description.strip() if self.description else ""
+        if not description:
             raise ValueError("Description cannot be empty")
-        return v.strip()
-
-    @field_validator('currency')
-    @classmethod
-    def validate_currency(cls, v: str) -> str:
-        """Normalize currency to uppercase."""
-        if not v:
+        self.__dict__["description"] = description
+        
+        if not self.currency:
             raise ValueError("Currency cannot be empty")
-        return v.upper().strip()
-
-    @field_validator('created_at', mode='before')
-    @classmethod
-    def validate_not_future(cls, v: datetime) -> datetime:
-        """Validate transaction date is not in the future."""
-        if isinstance(v, datetime) and v > datetime.now(timezone.utc):
+        # Interned: almost every row holds the same few currency codes
+        self.__dict__["currency"] = sys.intern(self.currency.upper().strip())
+        
+        # Cached "now" may lag the clock by up to _NOW_TTL, so allow that much slack
+        if self.created_at > _cached_now() + _NOW_TTL:
             raise ValueError("Transaction date cannot be in the future")
-        return v
-
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
-            "example": {
-                "user_id": 1,
-                "amount": "-150.50",
-                "currency": "UAH",
-                "description": "Groceries at ATB",
-                "category": "NEEDS",
-                "transaction_type": "EXPENSE",
-                "source": "MANUAL",
-                "is_ai_categorized": False
-            }
-        }
+        
+        return self
 
     def __repr__(self) -> str:
         """String representation."""
-        sign = "+" if self.amount > 0 else ""
-        return f"TransactionModel(id={self.id}, amount={sign}{self.amount} {self.currency}, {self.description[:30]})"
+        # Unvalidated instances may hold an int/float/None amount or no description
+        sign = "+" if self.amount is not None and self.amount > 0 else ""
+        description = (self.description or "")[:30]
+        return f"TransactionModel(id={self.id}, amount={sign}{self.amount} {self.currency}, {description})"
+
+
+class TransactionRead(BaseModel):
+    """
+    Read-only transaction view for API serialization and bulk reads.
+    
+    Plain frozen Pydantic model: no SQLAlchemy instance state or
+    relationship back-refs, so rows loaded for listing stay small.
+    Build with TransactionRead.model_validate(transaction_model).
+    """
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    user_id: int
+    amount: Decimal
+    currency: str
+    description: str
+    category: BudgetCategoryEnum
+    transaction_type: TransactionTypeEnum
+    source: TransactionSourceEnum
+    is_ai_categorized: bool
+    mono_transaction_id: Optional[str] = None
+    created_at: datetime
+    deleted_at: Optional[datetime] = None
+
+
+def validate_transactions(rows: Iterable[Any]) -> List[TransactionModel]:
+    """
+    Validate a batch of raw transaction rows (e.g. Monobank sync).
+    
+    Runs the same checks as TransactionModel.model_validate per row and
+    fails on the first invalid row. A TypeAdapter(list[TransactionModel])
+    can't be used here: pydantic calls the table model's own __init__,
+    which skips field validation.
+    """
+    validate = TransactionModel.model_validate
+    return [validate(row) for row in rows]
+
+
+# Related models imported after the class (not under TYPE_CHECKING) so each
+# module registers its relationship targets without a circular import
+from app.infrastructure.persistence.user_model import UserModel  # noqa: E402
@@ -0,0 +1,88 @@
+"""
+Custom SQLAlchemy column types shared by persistence models.
+"""
+import sys
+from decimal import Decimal, ROUND_HALF_EVEN
+from enum import Enum
+from typing import Any, Optional, Type
+
+from sqlalchemy import BigInteger, CheckConstraint, String
+from sqlalchemy.types import TypeDecorator
+
+_CENT = Decimal("0.01")
+
+
+class Cents(TypeDecorator):
+    """
+    Money stored as integer cents (BIGINT), exposed to Python as Decimal.
+    
+    Sums and comparisons in SQL run on integers; models and domain code
+    keep working with 2-place Decimal amounts.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[int]:
+        """Decimal (or int/str) amount -> integer cents."""
+        if value is None:
+            return None
+        if not isinstance(value, Decimal):
+            value = Decimal(str(value))
+        return int(value.quantize(_CENT, rounding=ROUND_HALF_EVEN).scaleb(2))
+
+    def process_result_value(self, value: Optional[int], dialect) -> Optional[Decimal]:
+        """Integer cents -> Decimal with 2 places."""
+        if value is None:
+            return None
+        return Decimal(value).scaleb(-2)
+
+
+class InternedString(TypeDecorator):
+    """
+    VARCHAR whose loaded values are interned.
+    
+    For low-cardinality free-text columns (currency) so identical values
+    across many loaded rows share one str object.
+    """
+    impl = String
+    cache_ok = True
+
+    def process_result_value(self, value: Optional[str], dialect) -> Optional[str]:
+        """Intern non-NULL values read from the DB."""
+        return sys.intern(value) if value is not None else None
+
+
+class EnumString(TypeDecorator):
+    """
+    VARCHAR holding a str-based enum's values, loaded back as enum members.
+    
+    Pairs with enum_check() instead of a native DB ENUM. Members are
+    singletons, so loaded rows share them without interning.
+    """
+    impl = String
+    cache_ok = True
+
+    def __init__(self, enum_cls: Type[Enum], length: int = 16) -> None:
+        super().__init__(length)
+        self.enum_cls = enum_cls
+
+    def process_bind_param(self, value: Any, dialect) -> Optional[str]:
+        """Enum member (or raw str) -> its string value."""
+        if isinstance(value, Enum):
+            return value.value
+        return value
+
+    def process_result_value(self, value: Optional[str], dialect) -> Optional[Enum]:
+        """Stored string -> enum member."""
+        return self.enum_cls(value) if value is not None else None
+
+
+def enum_check(column: str, enum_cls: Type[Enum], name: str) -> CheckConstraint:
+    """
+    CHECK constraint limiting a plain string column to the enum's values.
+    
+    Used instead of a native DB ENUM so str-based enum members are bound
+    as raw strings with no per-row coercion.
+    """
+    allowed = ", ".join(f"'{member.value}'" for member in enum_cls)
+    return CheckConstraint(f"{column} IN ({allowed})", name=name)
@@ -2,16 +2,21 @@
 SQLModel User - ORM model for database.
 Separate from domain entity (Dependency Inversion Principle).
 """
+import re
 from datetime import datetime, timezone
-from typing import Optional, List, TYPE_CHECKING
+from typing import Any, Mapping, Optional, List
 from sqlmodel import SQLModel, Field, Column, Relationship
-from sqlalchemy import String, Enum as SQLEnum, DateTime
-from pydantic import EmailStr, field_validator
+from sqlalchemy import String, DateTime
+from sqlalchemy.orm import make_transient_to_detached
+from pydantic import ConfigDict, EmailStr, field_validator
 import enum
 
-if TYPE_CHECKING:
-    from app.infrastructure.persistence.transaction_model import TransactionModel
-    from app.infrastructure.persistence.budget_model import BudgetModel
+from app.infrastructure.persistence.types import EnumString, enum_check
+from app.shared.helpers import utc_now
+
+# Webhook hash: ASCII letters/digits, 16-64 chars (charset + length in one match)
+_WEBHOOK_HASH_MATCH = re.compile(r"[A-Za-z0-9]{16,64}").fullmatch
+_ALNUM_MATCH = re.compile(r"[A-Za-z0-9]*").fullmatch
 
 
 class TrackingModeEnum(str, enum.Enum):
@@ -28,6 +33,22 @@ class UserModel(SQLModel, table=True):
     Includes validators for data integrity and security.
     """
     __tablename__ = "users"
+    
+    # Tracking mode is a plain string column limited by CHECK
+    __table_args__ = (
+        enum_check('tracking_mode', TrackingModeEnum, name='check_tracking_mode_valid'),
+    )
+
+    # Pydantic config
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "email": "user@example.com",
+            "password_hash": "$2b$12$KIXxLV2hFZ8y9z3F4Q5h1.XYZabcdefghijklmnopqrstuvwxyz1234",
+            "tracking_mode": "MANUAL",
+            "cash_reminder_enabled": True,
+            "is_premium": False
+        }
+    })
 
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
@@ -48,7 +69,7 @@ class UserModel(SQLModel, table=True):
     tracking_mode: TrackingModeEnum = Field(
         default=TrackingModeEnum.MANUAL,
         sa_column=Column(
-            SQLEnum(TrackingModeEnum),
+            EnumString(TrackingModeEnum),
             nullable=False,
             server_default=TrackingModeEnum.MANUAL.value
         ),
@@ -89,12 +110,12 @@ class UserModel(SQLModel, table=True):
 
     # Timestamps (using timezone-aware datetime)
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         sa_column=Column(DateTime(timezone=True), nullable=False),
         description="Account creation timestamp (UTC)"
     )
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
+        default_factory=utc_now,
         sa_column=Column(DateTime(timezone=True), nullable=False),
         description="Last update timestamp (UTC)"
     )
@@ -139,26 +160,45 @@ class UserModel(SQLModel, table=True):
     @field_validator('webhook_hash')
     @classmethod
     def validate_webhook_hash(cls, v: Optional[str]) -> Optional[str]:
-        """Validate webhook hash format (alphanumeric)."""
-        if v is not None:
-            if not v.isalnum():
-                raise ValueError("Webhook hash must be alphanumeric")
-            if len(v) < 16:
-                raise ValueError("Webhook hash must be at least 16 characters")
-        return v
-
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
-            "example": {
-                "email": "user@example.com",
-                "password_hash": "$2b$12$KIXxLV2hFZ8y9z3F4Q5h1.XYZabcdefghijklmnopqrstuvwxyz1234",
-                "tracking_mode": "MANUAL",
-                "cash_reminder_enabled": True,
-                "is_premium": False
-            }
-        }
+        """Validate webhook hash format (ASCII alphanumeric, 16+ chars)."""
+        if v is None or _WEBHOOK_HASH_MATCH(v) is not None:
+            return v
+        # Slow path only to pick the error message
+        if _ALNUM_MATCH(v) is None:
+            raise ValueError("Webhook hash must be alphanumeric")
+        raise ValueError("Webhook hash must be at least 16 characters")
+    
+    @classmethod
+    def from_orm_trusted(cls, row: Any) -> "UserModel":
+        """
+        Re-hydrate a user from an already-persisted row without re-validation.
+        
+        Accepts a Row/mapping (e.g. from a Core select) or any object with the
+        model's attributes. Validators run only on user-originated data
+        (model_validate); DB rows were validated when they were written.
+        
+        Table-model __init__ skips Pydantic validation but, unlike
+        model_construct, sets up SQLAlchemy instance state. A row with an id
+        comes back detached (persistent identity, no session): attach it with
+        session.add() or session.merge(user, load=False) and changes flush as
+        an UPDATE. Without an id the result is a new, transient user.
+        """
+        values = getattr(row, "_mapping", row)
+        if isinstance(values, Mapping):
+            data = {name: values[name] for name in cls.model_fields if name in values}
+        else:
+            data = {name: getattr(row, name) for name in cls.model_fields if hasattr(row, name)}
+        user = cls(**data)
+        if user.id is not None:
+            make_transient_to_detached(user)
+        return user
     
     def __repr__(self) -> str:
         """String representation (without sensitive data)."""
-        return f"UserModel(id={self.id}, email={self.email}, tracking_mode={self.tracking_mode})"
\ No newline at end of file
+        return f"UserModel(id={self.id}, email={self.email}, tracking_mode={self.tracking_mode})"
+
+
+# Related models imported after the class (not under TYPE_CHECKING) so each
+# module registers its relationship targets without a circular import
+from app.infrastructure.persistence.transaction_model import TransactionModel  # noqa: E402
+from app.infrastructure.persistence.budget_model import BudgetModel  # noqa: E402
@@ -2,17 +2,18 @@
 FastAPI Application Entry Point
 Follows Clean Architecture and Dependency Injection patterns
 """
-from fastapi import FastAPI, Request, status
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response, status
+from contextlib import AsyncExitStack, asynccontextmanager
+import orjson
 import structlog
-from typing import Dict, Any
 
-from app.core import settings, AppException
+from app.core import settings, engine
+from app.presentation.api.middleware import ExceptionASGIMiddleware, FastCORSMiddleware
+from app.shared.logger import configure_logging
 
 
 # Configure structured logging
+configure_logging()
 logger = structlog.get_logger()
 
 
@@ -21,23 +22,32 @@ async def lifespan(app: FastAPI):
     """
     Lifespan context manager for startup and shutdown events.
     Replaces deprecated @app.on_event decorators.
+
+    Resources are registered on one AsyncExitStack and released in
+    reverse order on shutdown; add new ones (Redis, sub-app lifespans)
+    with stack.enter_async_context(...) instead of nesting.
     """
-    # Startup
-    logger.info(
-        "application_startup",
-        app_name=settings.app_name,
-        version=settings.app_version,
-        environment=settings.environment
-    )
+    # Bound before the first log call so structlog's logger cache is
+    # built during startup, not on the first request
+    lifespan_logger = structlog.get_logger().bind(component="lifespan")
+
+    async with AsyncExitStack() as stack:
+        # Startup
+        lifespan_logger.info(
+            "application_startup",
+            app_name=settings.app_name,
+            version=settings.app_version,
+            environment=settings.environment
+        )
 
-    # Initialize database connection (will be done in Alembic migrations)
-    # For now, just log that we're ready
-    logger.info("database_connection_ready", db_host=settings.db_host)
+        # Close pooled DB connections on shutdown
+        stack.push_async_callback(engine.dispose)
+        lifespan_logger.info("database_connection_ready", db_host=settings.db_host)
 
-    yield
+        yield
 
-    # Shutdown
-    logger.info("application_shutdown")
+        # Shutdown
+        lifespan_logger.info("application_shutdown")
 
 
 # Initialize FastAPI application
@@ -47,105 +57,70 @@ app = FastAPI(
     description="AI-powered financial management backend with Monobank integration",
     docs_url="/docs" if settings.debug else None,  # Hide docs in production
     redoc_url="/redoc" if settings.debug else None,
+    # No schema route in production: OpenAPI generation never runs there
+    openapi_url="/openapi.json" if settings.debug else None,
     lifespan=lifespan
 )
 
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Global error handling (pure ASGI). Added before CORS so it sits inside it
+# and error responses still get CORS headers.
+app.add_middleware(ExceptionASGIMiddleware)
 
+# Configure CORS (origin list and headers precomputed once)
+app.add_middleware(FastCORSMiddleware, origins=settings.cors_origins)
 
-# Global exception handler
-@app.exception_handler(AppException)
-async def app_exception_handler(request: Request, exc: AppException):
-    """Handle custom application exceptions."""
-    logger.error(
-        "application_error",
-        error=exc.message,
-        status_code=exc.status_code,
-        details=exc.details,
-        path=request.url.path
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.message,
-            "details": exc.details,
-            "path": str(request.url.path)
-        }
-    )
-
-
-@app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception):
-    """Handle unexpected exceptions."""
-    logger.exception(
-        "unexpected_error",
-        error=str(exc),
-        path=request.url.path
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content={
-            "error": "Internal server error",
-            "details": {} if not settings.debug else {"message": str(exc)},
-            "path": str(request.url.path)
-        }
-    )
+
+# Static endpoint payloads, serialized once at import (they never change
+# for the lifetime of the process)
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "app_name": settings.app_name,
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "database": {
+        "host": settings.db_host,
+        "status": "connected"  # Will be enhanced with actual DB check later
+    }
+})
+_ROOT_BYTES = orjson.dumps({
+    "message": f"Welcome to {settings.app_name} API",
+    "version": settings.app_version,
+    "docs": "/docs" if settings.debug else "Documentation disabled in production",
+    "health": "/health"
+})
 
 
 # Health check endpoint
 @app.get(
     "/health",
     tags=["Health"],
-    response_model=Dict[str, Any],
+    response_class=Response,
     status_code=status.HTTP_200_OK,
     summary="Health Check",
     description="Check if the API is running and database is accessible"
 )
-async def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """
     Health check endpoint for monitoring and load balancers.
 
     Returns:
-        Dictionary with application status and version info
+        Pre-serialized JSON with application status and version info
     """
-    return {
-        "status": "healthy",
-        "app_name": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "database": {
-            "host": settings.db_host,
-            "status": "connected"  # Will be enhanced with actual DB check later
-        }
-    }
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
 
 
 # Root endpoint
 @app.get(
     "/",
     tags=["Root"],
-    response_model=Dict[str, str],
+    response_class=Response,
     summary="API Root",
     description="Welcome message and API information"
 )
-async def root() -> Dict[str, str]:
+async def root() -> Response:
     """Root endpoint with welcome message."""
-    return {
-        "message": f"Welcome to {settings.app_name} API",
-        "version": settings.app_version,
-        "docs": "/docs" if settings.debug else "Documentation disabled in production",
-        "health": "/health"
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 # API v1 router will be added here
@@ -154,6 +129,7 @@ async def root() -> Dict[str, str]:
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
     uvicorn.run(
@@ -161,5 +137,10 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
-        log_level="debug" if settings.debug else "info"
+        log_level="debug" if settings.debug else "info",
+        # libuv event loop + C HTTP parser; uvloop isn't available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Also sizes each worker's DB pool (see Settings.db_max_connections)
+        workers=settings.worker_count
     )
\ No newline at end of file
@@ -0,0 +1,5 @@
+"""API middleware."""
+from app.presentation.api.middleware.cors import FastCORSMiddleware
+from app.presentation.api.middleware.error_handler import ExceptionASGIMiddleware
+
+__all__ = ["ExceptionASGIMiddleware", "FastCORSMiddleware"]
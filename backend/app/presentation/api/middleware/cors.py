@@ -0,0 +1,104 @@
+"""
+CORS middleware.
+Pure ASGI: the origin allow-list and all response header tuples are built
+once at startup, so each request costs one header scan and a set lookup.
+"""
+from typing import Iterable, List, Optional, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Headers = List[Tuple[bytes, bytes]]
+
+_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+_PREFLIGHT_MAX_AGE = b"600"
+
+
+class FastCORSMiddleware:
+    """
+    CORS for a fixed list of origins, with credentials.
+
+    Equivalent to Starlette's CORSMiddleware configured with
+    allow_credentials=True, allow_methods=["*"] and allow_headers=["*"]:
+    - allowed origins are echoed back (a "*" origin is not valid with
+      credentials), with Vary: Origin
+    - preflight requests are answered here and never reach the app;
+      requested headers are echoed back
+    - "*" in origins allows any origin
+    """
+
+    def __init__(self, app: ASGIApp, origins: Iterable[str]) -> None:
+        self.app = app
+        self._allowed_origins = frozenset(origin.encode("latin-1") for origin in origins)
+        self._allow_all = b"*" in self._allowed_origins
+        self._cors_headers: Headers = [
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+        self._preflight_headers: Headers = self._cors_headers + [
+            (b"access-control-allow-methods", _METHODS),
+            (b"access-control-max-age", _PREFLIGHT_MAX_AGE),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: Optional[bytes] = None
+        request_method: Optional[bytes] = None
+        request_headers: Optional[bytes] = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self._allow_all or origin in self._allowed_origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, allowed, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._cors_headers + [(b"access-control-allow-origin", origin)]
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _preflight(
+        self,
+        send: Send,
+        origin: bytes,
+        allowed: bool,
+        request_headers: Optional[bytes]
+    ) -> None:
+        """Answer a preflight request directly."""
+        if not allowed:
+            body = b"Disallowed CORS origin"
+            headers: Headers = [(b"content-type", b"text/plain; charset=utf-8"), (b"vary", b"Origin")]
+            status = 400
+        else:
+            body = b"OK"
+            headers = self._preflight_headers + [
+                (b"access-control-allow-origin", origin),
+                (b"content-type", b"text/plain; charset=utf-8"),
+            ]
+            if request_headers is not None:
+                headers.append((b"access-control-allow-headers", request_headers))
+            status = 200
+        headers.append((b"content-length", str(len(body)).encode()))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,87 @@
+"""
+Error handling middleware.
+Pure ASGI: turns uncaught exceptions into JSON error responses without
+building Request/JSONResponse objects on the error path.
+"""
+from typing import Any, Dict
+
+import orjson
+import structlog
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings, AppException
+
+logger = structlog.get_logger()
+
+_JSON_HEADERS = [(b"content-type", b"application/json")]
+
+
+class ExceptionASGIMiddleware:
+    """
+    Catch AppException / unexpected exceptions and send a JSON error body.
+
+    Response shape: {"error": ..., "details": {...}, "path": ...}
+    If the response has already started, the exception is re-raised
+    (a second response cannot be sent).
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Plain str already in the scope: no Request/URL objects on the error path
+        path = scope.get("path", "")
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except AppException as exc:
+            if response_started:
+                raise
+            details = dict(exc.details)
+            logger.error(
+                "application_error",
+                error=exc.message,
+                status_code=exc.status_code,
+                details=details,
+                path=path
+            )
+            await _send_error(send, exc.status_code, {
+                "error": exc.message,
+                "details": details,
+                "path": path
+            })
+        except Exception as exc:
+            if response_started:
+                raise
+            logger.exception(
+                "unexpected_error",
+                error=str(exc),
+                path=path
+            )
+            await _send_error(send, 500, {
+                "error": "Internal server error",
+                "details": {} if not settings.debug else {"message": str(exc)},
+                "path": path
+            })
+
+
+async def _send_error(send: Send, status_code: int, content: Dict[str, Any]) -> None:
+    """Send a complete JSON response (serialized in one orjson call)."""
+    body = orjson.dumps(content, default=str)
+    await send({
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": _JSON_HEADERS + [(b"content-length", str(len(body)).encode())]
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,8 @@
+"""
+Small framework-independent helpers shared across layers.
+"""
+from datetime import datetime, timezone
+from functools import partial
+
+# Timezone-aware "now"; a partial, so it works directly as a default_factory
+utc_now = partial(datetime.now, timezone.utc)
@@ -0,0 +1,63 @@
+"""
+Structured logging configuration (structlog).
+"""
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Any, Optional
+
+import orjson
+import structlog
+
+from app.core.config import settings
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjson serializer returning str (stdlib logging expects text)."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def configure_logging() -> None:
+    """
+    Configure structlog once at startup.
+
+    Log lines are rendered to JSON with orjson and handed to stdlib logging,
+    whose root logger only has a QueueHandler: request code does a
+    lock-free queue put, and a QueueListener thread writes to stderr.
+    Loggers are cached on first use.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    level = logging.DEBUG if settings.debug else logging.INFO
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(
+        log_queue,
+        logging.StreamHandler(sys.stderr),
+        respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(_listener.stop)
+
+    structlog.configure(
+        processors=[
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
+        ],
+        # Level check happens before any processor runs
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
@@ -1,45 +1,255 @@
 """Pytest configuration and shared fixtures."""
 import os
+import bcrypt
 import pytest
-from typing import Generator
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+from typing import Any, AsyncGenerator, Callable, Generator, Mapping, Sequence
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
 
-from app.main import app
-from app.core.database import get_session
+# Test environment, set once per pytest process (before the app and settings import)
+os.environ.setdefault("ENVIRONMENT", "testing")
+os.environ.setdefault("DEBUG", "True")
 
+from app.main import app  # noqa: E402
+from app.core.database import get_session  # noqa: E402
+from app.infrastructure.persistence import BudgetModel, TransactionModel, UserModel  # noqa: E402
 
-# Test database URL (in-memory SQLite for fast tests)
-TEST_DATABASE_URL = "sqlite:///:memory:"
 
+# Test database URL: in-memory SQLite by default (fast, one per xdist worker);
+# set TEST_DATABASE_URL to a Postgres URL to run the same suite against a real
+# server (e.g. nightly CI). Workers would share that database, so use -n 0.
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "sqlite:///:memory:")
 
-@pytest.fixture(name="engine")
-def engine_fixture():
-    """Create test database engine (in-memory SQLite)."""
-    engine = create_engine(
-        TEST_DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,  # Reuse connection for in-memory DB
+# PYTEST_REUSE_DB=1 keeps the schema between runs: SQLite moves to a file per
+# xdist worker under .test-db/, tables are created only if missing and never
+# dropped; pass --recreate-db after model changes. Test rows are never kept
+# (the shared connection's transaction is always rolled back).
+REUSE_DB = os.environ.get("PYTEST_REUSE_DB") == "1"
+_REUSE_DB_DIR = Path(__file__).resolve().parent.parent / ".test-db"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--recreate-db",
+        action="store_true",
+        default=False,
+        help="drop and recreate the reused test schema (with PYTEST_REUSE_DB=1)"
     )
-    SQLModel.metadata.create_all(engine)
+
+
+def _test_database_url() -> str:
+    """TEST_DATABASE_URL, or a per-worker SQLite file when reusing an in-memory DB."""
+    if not (REUSE_DB and TEST_DATABASE_URL == "sqlite:///:memory:"):
+        return TEST_DATABASE_URL
+    _REUSE_DB_DIR.mkdir(exist_ok=True)
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    return f"sqlite:///{_REUSE_DB_DIR / worker}.db"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_models(valid_password_hash: str):
+    """
+    Run each ORM model's validator once per test process.
+    
+    Schemas are built at import, but the first validation of each model
+    still pays one-off costs (SQLAlchemy instance setup, lazy imports);
+    paying them here keeps them out of the first test that uses the model.
+    """
+    BudgetModel.model_validate({
+        "user_id": 1,
+        "monthly_income": Decimal("30000.00"),
+        "needs_allocated": Decimal("15000.00"),
+        "wants_allocated": Decimal("9000.00"),
+        "savings_allocated": Decimal("6000.00"),
+        "period_start_date": date(2026, 1, 1),
+        "period_end_date": date(2026, 1, 31)
+    })
+    UserModel.model_validate({
+        "email": "warmup@example.com",
+        "password_hash": valid_password_hash
+    })
+    TransactionModel.model_validate({
+        "user_id": 1,
+        "amount": Decimal("-1.00"),
+        "description": "warmup",
+        "category": "NEEDS",
+        "transaction_type": "EXPENSE"
+    })
+
+
+@pytest.fixture(name="valid_password_hash", scope="session")
+def valid_password_hash_fixture() -> str:
+    """
+    Real bcrypt hash of "test", computed once per test process.
+    
+    Cost 4 keeps it to a few milliseconds; the format is identical to a
+    production hash, so it passes any password_hash validation.
+    """
+    return bcrypt.hashpw(b"test", bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.fixture(name="engine", scope="session")
+def engine_fixture(request):
+    """Create test database engine and schema once per test session."""
+    url = _test_database_url()
+    if not url.startswith("sqlite"):
+        engine = create_engine(url)
+    else:
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,  # Reuse connection for in-memory DB
+        )
+        
+        @event.listens_for(engine, "connect")
+        def _configure_sqlite(dbapi_connection, connection_record):
+            # pysqlite starts transactions lazily and mishandles SAVEPOINT; let
+            # SQLAlchemy emit BEGIN itself so nested transactions work
+            dbapi_connection.isolation_level = None
+            # No fsync/journal files for throwaway test data; enforce FKs like Postgres
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA synchronous=OFF")
+            cursor.execute("PRAGMA journal_mode=MEMORY")
+            cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute("PRAGMA foreign_keys=ON")
+            cursor.close()
+        
+        @event.listens_for(engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+    
+    if REUSE_DB and request.config.getoption("--recreate-db"):
+        SQLModel.metadata.drop_all(engine)
+    SQLModel.metadata.create_all(engine)  # only creates missing tables
     yield engine
-    SQLModel.metadata.drop_all(engine)
+    if not REUSE_DB:
+        SQLModel.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture(name="connection", scope="session")
+def connection_fixture(engine):
+    """One connection and outer transaction for the whole run (never committed)."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    yield connection
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(name="session")
-def session_fixture(engine) -> Generator[Session, None, None]:
-    """Database session for tests."""
-    with Session(engine) as session:
+def session_fixture(connection) -> Generator[Session, None, None]:
+    """
+    Database session for tests, isolated by a SAVEPOINT rolled back afterwards.
+    
+    The session joins the shared connection with its own SAVEPOINT, so
+    session.commit() / session.rollback() inside a test only release or
+    roll back that SAVEPOINT; every test starts from an empty schema.
+    """
+    nested = connection.begin_nested()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    try:
         yield session
+    finally:
+        session.close()
+        if nested.is_active:
+            nested.rollback()
+
+
+@pytest.fixture(name="user")
+def user_fixture(session: Session, valid_password_hash: str) -> UserModel:
+    """
+    Persisted user for tests that only need an owner row.
+    
+    Flushed (not committed) so it gets an id; removed by the
+    session fixture's rollback like everything else.
+    """
+    user = UserModel(
+        email=f"u{uuid4().hex}@example.com",
+        password_hash=valid_password_hash
+    )
+    session.add(user)
+    session.flush()
+    return user
+
+
+@pytest.fixture(name="persistent_user", scope="class")
+def persistent_user_fixture(connection, valid_password_hash: str) -> Generator[UserModel, None, None]:
+    """
+    Owner row shared by every test in a class.
+    
+    Inserted once inside a class-level SAVEPOINT (each test's session
+    SAVEPOINT nests inside it) and rolled back after the class. The
+    instance is detached: read persistent_user.id directly, or attach it
+    with session.merge(persistent_user, load=False) to use relationships.
+    """
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as class_session:
+        user = UserModel(
+            email=f"u{uuid4().hex}@example.com",
+            password_hash=valid_password_hash
+        )
+        class_session.add(user)
+        class_session.flush()
+        class_session.expunge(user)
+        yield user
+        class_session.rollback()
+
+
+@pytest.fixture(name="bulk_create_transactions")
+def bulk_create_transactions_fixture(session: Session) -> Callable[..., None]:
+    """
+    Insert n expense transactions for a user in one Core INSERT.
+    
+    Rows go straight to the table (executemany), skipping model validation
+    and the ORM unit of work; use it for tests that need many rows but
+    don't care about most of their contents. ``overrides[i]`` is merged
+    over row i, e.g. to make one row an income. Loaded relationships are
+    not updated, so re-query or refresh afterwards.
+    """
+    def bulk_create(
+        user_id: int, n: int, overrides: Sequence[Mapping[str, Any]] = ()
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "user_id": user_id,
+                "amount": Decimal(-(i + 1)),
+                "currency": "UAH",
+                "description": f"Expense {i}",
+                "category": "NEEDS",
+                "transaction_type": "EXPENSE",
+                "source": "MANUAL",
+                "is_ai_categorized": False,
+                "created_at": now,
+                **(overrides[i] if i < len(overrides) else {})
+            }
+            for i in range(n)
+        ]
+        session.connection().execute(TransactionModel.__table__.insert(), rows)
+    
+    return bulk_create
 
 
 @pytest.fixture(name="client")
 def client_fixture(session: Session) -> Generator[TestClient, None, None]:
-    """FastAPI test client with overridden database session."""
+    """
+    FastAPI test client with overridden database session.
+    
+    Endpoints get a real AsyncSession, as in production, proxying the
+    test's sync session (the pysqlite driver never awaits, so greenlet_spawn
+    just runs each call). It is not closed here: the session fixture owns
+    the SAVEPOINT and rolls it back after the test.
+    """
     
-    def get_session_override():
-        return session
+    async def get_session_override() -> AsyncGenerator[AsyncSession, None]:
+        yield AsyncSession(sync_session_class=lambda **_: session)
     
     app.dependency_overrides[get_session] = get_session_override
     
@@ -48,11 +258,3 @@ def client_fixture(session: Session) -> Generator[TestClient, None, None]:
     
     app.dependency_overrides.clear()
 
-
-@pytest.fixture(autouse=True)
-def set_test_env():
-    """Set test environment variables."""
-    os.environ["ENVIRONMENT"] = "testing"
-    os.environ["DEBUG"] = "True"
-    yield
-    # Cleanup after test
@@ -0,0 +1,74 @@
+"""
+Unit tests for application settings.
+"""
+import pytest
+from app.core.config import Settings, get_settings, settings
+
+
+class TestGetSettings:
+    """Test settings singleton behaviour."""
+    
+    def test_get_settings_is_memoized(self):
+        """Repeated calls should return the same instance."""
+        assert isinstance(settings, Settings)
+        assert get_settings() is get_settings()
+    
+    def test_cache_clear_rereads_environment(self, monkeypatch):
+        """Clearing the cache should build settings from current env."""
+        monkeypatch.setenv("APP_NAME", "Test App")
+        get_settings.cache_clear()
+        try:
+            fresh = get_settings()
+            assert isinstance(fresh, Settings)
+            assert fresh is not settings
+            assert fresh.app_name == "Test App"
+        finally:
+            get_settings.cache_clear()
+
+
+class TestCorsOriginsParsing:
+    """Test CORS_ORIGINS parsing from environment strings."""
+    
+    def test_json_list(self):
+        """JSON list string should be decoded."""
+        parsed = Settings.parse_cors_origins('["http://a.com", "http://b.com"]')
+        assert parsed == ["http://a.com", "http://b.com"]
+    
+    def test_comma_separated(self):
+        """Comma-separated string should be split and stripped."""
+        parsed = Settings.parse_cors_origins(" http://a.com, http://b.com ,")
+        assert parsed == ["http://a.com", "http://b.com"]
+    
+    def test_list_passthrough(self):
+        """Lists should be returned unchanged."""
+        origins = ["http://a.com"]
+        assert Settings.parse_cors_origins(origins) is origins
+
+
+class TestDatabasePoolSizing:
+    """Test per-worker pool sizing from the global connection budget."""
+    
+    @pytest.mark.parametrize("workers", [1, 2, 4, 8])
+    def test_workers_share_the_connection_budget(self, workers):
+        """All workers' pools together should stay within db_max_connections."""
+        config = Settings(web_workers=workers, db_max_connections=60, debug=False)
+        
+        per_worker = config.db_pool_size + config.db_max_overflow
+        assert config.worker_count == workers
+        assert workers * per_worker <= 60
+        assert config.db_pool_size >= 1
+    
+    def test_workers_capped_at_the_connection_budget(self):
+        """More workers than connections must not push the total over budget."""
+        config = Settings(web_workers=100, db_max_connections=60, debug=False)
+        
+        per_worker = config.db_pool_size + config.db_max_overflow
+        assert config.worker_count == 60
+        assert config.worker_count * per_worker <= 60
+    
+    def test_debug_runs_a_single_worker(self):
+        """Reload mode needs one worker, which then gets the whole budget."""
+        config = Settings(web_workers=8, db_max_connections=60, debug=True)
+        
+        assert config.worker_count == 1
+        assert config.db_pool_size + config.db_max_overflow == 60
@@ -0,0 +1,29 @@
+"""
+Unit tests for application exceptions.
+"""
+import pytest
+
+from app.core.exceptions import AppException, NotFoundException, ValidationException
+
+
+class TestExceptionDetails:
+    """Test details handling on AppException and subclasses."""
+    
+    def test_default_details_are_shared_and_read_only(self):
+        """Exceptions without details share one immutable empty mapping."""
+        first = NotFoundException()
+        second = ValidationException()
+        
+        assert first.details == {}
+        assert first.details is second.details
+        with pytest.raises(TypeError):
+            first.details["key"] = "value"
+    
+    def test_caller_details_are_kept(self):
+        """A dict passed by the caller is stored as-is."""
+        details = {"field": "amount"}
+        
+        exc = AppException("Bad amount", status_code=400, details=details)
+        
+        assert exc.details is details
+        assert exc.status_code == 400
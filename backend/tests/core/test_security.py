@@ -2,7 +2,28 @@
 Unit tests for password hashing and verification.
 """
 import pytest
-from app.core.security import hash_password, verify_password
+from app.core import security
+from app.core.security import (
+    hash_password,
+    verify_password,
+    verify_and_maybe_rehash,
+    ahash_password,
+    averify_password
+)
+
+
+@pytest.fixture(autouse=True)
+def _fast_bcrypt(request, monkeypatch):
+    """
+    Hash with cost 4 instead of the production 12 (256x less work per call).
+    
+    Tests that check the real cost factor opt out with @pytest.mark.no_fast_bcrypt.
+    """
+    if request.node.get_closest_marker("no_fast_bcrypt") is None:
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", 4)
+    security._get_pwd_context.cache_clear()
+    yield
+    security._get_pwd_context.cache_clear()
 
 
 class TestPasswordHashing:
@@ -54,6 +75,38 @@ class TestPasswordHashing:
         assert password.lower() not in hashed.lower()
 
 
+@pytest.mark.parametrize("password", [
+    "TestPassword123",
+    "MySecurePassword123",
+    "P@ssw0rd!#$%^&*()",
+    "Пароль123🔐",
+    "a" * 100,
+    "",
+])
+class TestPasswordRoundtrip:
+    """Hash/verify checks run for every password (formerly the manual script)."""
+    
+    def test_hash_format(self, password):
+        """Hash is a 60-char bcrypt string."""
+        hashed = hash_password(password)
+        
+        assert hashed.startswith("$2b$")
+        assert len(hashed) == 60
+    
+    def test_roundtrip(self, password):
+        """Password verifies against its own hash; a different one doesn't."""
+        hashed = hash_password(password)
+        
+        assert verify_password(password, hashed) is True
+        assert verify_password("x" + password, hashed) is False
+    
+    def test_hash_does_not_contain_password(self, password):
+        """Hash never contains the plaintext."""
+        if not password:
+            pytest.skip("empty string is contained in every string")
+        assert password not in hash_password(password)
+
+
 class TestPasswordVerification:
     """Test password verification edge cases."""
     
@@ -112,6 +165,7 @@ class TestPasswordSecurity:
         
         assert verify_password(unicode_password, hashed) is True
     
+    @pytest.mark.no_fast_bcrypt
     def test_hashing_performance(self):
         """Hashing should complete in reasonable time."""
         import time
@@ -125,6 +179,7 @@ class TestPasswordSecurity:
         assert duration < 0.5
 
 
+@pytest.mark.no_fast_bcrypt
 class TestBcryptRounds:
     """Test bcrypt rounds configuration."""
     
@@ -137,3 +192,81 @@ class TestBcryptRounds:
         # The "12" is the cost factor (rounds = 2^12)
         cost_factor = hashed.split("$")[2]
         assert cost_factor == "12"
+    
+    def test_hash_uses_configured_rounds(self, monkeypatch):
+        """Cost factor should follow settings.bcrypt_rounds."""
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", 4)
+        security._get_pwd_context.cache_clear()
+        try:
+            hashed = hash_password("password")
+        finally:
+            security._get_pwd_context.cache_clear()
+        
+        assert hashed.split("$")[2] == "04"
+        assert verify_password("password", hashed) is True
+
+
+class TestRehashOnLogin:
+    """Test transparent bcrypt cost upgrade on login."""
+    
+    def _hash_with_rounds(self, monkeypatch, rounds: int, password: str) -> str:
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", rounds)
+        security._get_pwd_context.cache_clear()
+        return hash_password(password)
+    
+    @pytest.fixture(autouse=True)
+    def _reset_context(self):
+        yield
+        security._get_pwd_context.cache_clear()
+    
+    def test_outdated_hash_is_upgraded(self, monkeypatch):
+        """Hash below configured cost should come back rehashed."""
+        old_hash = self._hash_with_rounds(monkeypatch, 4, "password")
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", 5)
+        security._get_pwd_context.cache_clear()
+        
+        ok, new_hash = verify_and_maybe_rehash("password", old_hash)
+        
+        assert ok is True
+        assert new_hash is not None
+        assert new_hash.split("$")[2] == "05"
+        assert verify_password("password", new_hash) is True
+    
+    def test_current_hash_is_not_rehashed(self, monkeypatch):
+        """Hash at (or above) configured cost should not be touched."""
+        current_hash = self._hash_with_rounds(monkeypatch, 5, "password")
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", 4)
+        security._get_pwd_context.cache_clear()
+        
+        assert verify_and_maybe_rehash("password", current_hash) == (True, None)
+    
+    def test_wrong_password_never_rehashes(self, monkeypatch):
+        """Failed verification should not produce a new hash."""
+        old_hash = self._hash_with_rounds(monkeypatch, 4, "password")
+        monkeypatch.setattr(security.settings, "bcrypt_rounds", 5)
+        security._get_pwd_context.cache_clear()
+        
+        assert verify_and_maybe_rehash("wrong", old_hash) == (False, None)
+    
+    def test_invalid_hash_returns_false(self):
+        """Invalid hash format should be handled gracefully."""
+        assert verify_and_maybe_rehash("password", "invalid_hash") == (False, None)
+
+
+class TestAsyncPasswordHelpers:
+    """Test thread-pool backed async wrappers."""
+    
+    @pytest.mark.asyncio
+    async def test_ahash_and_averify_roundtrip(self):
+        """Async hash should verify with both sync and async helpers."""
+        hashed = await ahash_password("AsyncPassword123")
+        
+        assert hashed.startswith("$2b$")
+        assert verify_password("AsyncPassword123", hashed) is True
+        assert await averify_password("AsyncPassword123", hashed) is True
+        assert await averify_password("WrongPassword", hashed) is False
+    
+    @pytest.mark.asyncio
+    async def test_averify_invalid_hash_returns_false(self):
+        """Invalid hash should be handled gracefully in async path."""
+        assert await averify_password("password", "invalid_hash") is False
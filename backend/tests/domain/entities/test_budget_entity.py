@@ -10,245 +10,143 @@ from app.domain.entities.budget import Budget
 from app.domain.value_objects.budget_category import BudgetCategory
 
 
+pytestmark = pytest.mark.unit
+
+
+# Shared amounts (Decimal is immutable, so parse once per module)
+_INCOME = Decimal('30000.00')
+_NEEDS_ALLOCATED = Decimal('15000.00')
+_WANTS_ALLOCATED = Decimal('9000.00')
+_SAVINGS_ALLOCATED = Decimal('6000.00')
+_SPENT_3K = Decimal('3000.00')
+_SPENT_20K = Decimal('20000.00')
+
+# Dates around the January 2026 budget period
+_DEC_31_2025 = date(2025, 12, 31)
+_JAN_1 = date(2026, 1, 1)
+_JAN_15 = date(2026, 1, 15)
+_JAN_16 = date(2026, 1, 16)
+_JAN_31 = date(2026, 1, 31)
+_FEB_1 = date(2026, 2, 1)
+
+
+# Budget categories bound once (plain global loads in test bodies)
+_NEEDS = BudgetCategory.NEEDS
+_WANTS = BudgetCategory.WANTS
+_SAVINGS = BudgetCategory.SAVINGS
+
+
+@pytest.fixture(name="budget", scope="module")
+def budget_fixture() -> Budget:
+    """January 2026 budget for 30000 income, split 50/30/20 (shared, not mutated by tests)."""
+    return Budget(
+        id=1,
+        user_id=1,
+        monthly_income=_INCOME,
+        period_start_date=_JAN_1,
+        period_end_date=_JAN_31,
+        needs_allocated=_NEEDS_ALLOCATED,
+        wants_allocated=_WANTS_ALLOCATED,
+        savings_allocated=_SAVINGS_ALLOCATED,
+        created_at=datetime.now(timezone.utc)
+    )
+
+
 class TestBudgetEntity:
     """Test Budget domain entity business logic."""
     
-    def test_budget_creation(self):
+    def test_budget_creation(self, budget):
         """Test basic budget creation."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        assert budget.monthly_income == Decimal('30000.00')
-        assert budget.needs_allocated == Decimal('15000.00')
+        assert budget.monthly_income == _INCOME
+        assert budget.needs_allocated == _NEEDS_ALLOCATED
     
-    def test_calculate_50_30_20(self):
+    def test_calculate_50_30_20(self, budget):
         """Test 50/30/20 calculation from income."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         needs, wants, savings = budget.calculate_50_30_20()
         
-        assert needs == Decimal('15000.00')  # 50%
-        assert wants == Decimal('9000.00')   # 30%
-        assert savings == Decimal('6000.00') # 20%
+        assert needs == _NEEDS_ALLOCATED  # 50%
+        assert wants == _WANTS_ALLOCATED  # 30%
+        assert savings == _SAVINGS_ALLOCATED  # 20%
     
-    def test_get_allocated_for_category(self):
+    def test_get_allocated_for_category(self, budget):
         """Test getting allocated amount for specific category."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        assert budget.get_allocated_for_category(BudgetCategory.NEEDS) == Decimal('15000.00')
-        assert budget.get_allocated_for_category(BudgetCategory.WANTS) == Decimal('9000.00')
-        assert budget.get_allocated_for_category(BudgetCategory.SAVINGS) == Decimal('6000.00')
+        assert budget.get_allocated_for_category(_NEEDS) == _NEEDS_ALLOCATED
+        assert budget.get_allocated_for_category(_WANTS) == _WANTS_ALLOCATED
+        assert budget.get_allocated_for_category(_SAVINGS) == _SAVINGS_ALLOCATED
     
-    def test_get_remaining_budget(self):
+    def test_get_remaining_budget(self, budget):
         """Test calculating remaining budget."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         # Spent 3000 from NEEDS budget
         remaining = budget.get_remaining_budget(
-            BudgetCategory.NEEDS,
-            Decimal('3000.00')
+            _NEEDS,
+            _SPENT_3K
         )
         
         assert remaining == Decimal('12000.00')  # 15000 - 3000
     
-    def test_get_safe_to_spend(self):
+    def test_get_safe_to_spend(self, budget):
         """Test Safe-to-Spend calculation."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         # January 16: 16 days left (including today)
         # Spent: 3000
         # Remaining: 12000
         # Safe: 12000 / 16 = 750
         safe = budget.get_safe_to_spend(
-            BudgetCategory.NEEDS,
-            total_spent=Decimal('3000.00'),
-            current_date=date(2026, 1, 16)
+            _NEEDS,
+            total_spent=_SPENT_3K,
+            current_date=_JAN_16
         )
         
         assert safe == Decimal('750.00')
     
-    def test_safe_to_spend_when_overspent(self):
+    def test_safe_to_spend_when_overspent(self, budget):
         """Test Safe-to-Spend returns 0 when overspent."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         # Overspent
         safe = budget.get_safe_to_spend(
-            BudgetCategory.NEEDS,
-            total_spent=Decimal('20000.00'),
-            current_date=date(2026, 1, 16)
+            _NEEDS,
+            total_spent=_SPENT_20K,
+            current_date=_JAN_16
         )
         
         assert safe == Decimal('0.00')
     
-    def test_safe_to_spend_when_period_ended(self):
+    def test_safe_to_spend_when_period_ended(self, budget):
         """Test Safe-to-Spend returns 0 when period ended."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         # After period ended
         safe = budget.get_safe_to_spend(
-            BudgetCategory.NEEDS,
-            total_spent=Decimal('3000.00'),
-            current_date=date(2026, 2, 1)  # Next month
+            _NEEDS,
+            total_spent=_SPENT_3K,
+            current_date=_FEB_1  # Next month
         )
         
         assert safe == Decimal('0.00')
     
-    def test_is_overspent(self):
+    def test_is_overspent(self, budget):
         """Test overspent detection."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        assert not budget.is_overspent(BudgetCategory.NEEDS, Decimal('3000.00'))
-        assert budget.is_overspent(BudgetCategory.NEEDS, Decimal('20000.00'))
+        assert not budget.is_overspent(_NEEDS, _SPENT_3K)
+        assert budget.is_overspent(_NEEDS, _SPENT_20K)
     
-    def test_is_active(self):
+    def test_is_active(self, budget):
         """Test period active check."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
-        assert budget.is_active(date(2026, 1, 15))  # During period
-        assert not budget.is_active(date(2026, 2, 1))  # After period
-        assert not budget.is_active(date(2025, 12, 31))  # Before period
+        assert budget.is_active(_JAN_15)  # During period
+        assert not budget.is_active(_FEB_1)  # After period
+        assert not budget.is_active(_DEC_31_2025)  # Before period
     
-    def test_get_progress_percentage(self):
+    def test_get_progress_percentage(self, budget):
         """Test spending progress calculation."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         # Spent 3000 of 15000 = 20%
         progress = budget.get_progress_percentage(
-            BudgetCategory.NEEDS,
-            Decimal('3000.00')
+            _NEEDS,
+            _SPENT_3K
         )
         
         assert progress == Decimal('20.00')
     
-    def test_get_days_in_period(self):
+    def test_get_days_in_period(self, budget):
         """Test getting total days in period."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         assert budget.get_days_in_period() == 31
     
-    def test_string_representation(self):
+    def test_string_representation(self, budget):
         """Test __str__ method."""
-        budget = Budget(
-            id=1,
-            user_id=1,
-            monthly_income=Decimal('30000.00'),
-            period_start_date=date(2026, 1, 1),
-            period_end_date=date(2026, 1, 31),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
-            created_at=datetime.now(timezone.utc)
-        )
-        
         result = str(budget)
         assert "2026-01" in result
         assert "30000" in result
@@ -12,103 +12,101 @@ from app.domain.value_objects.transaction_source import TransactionSource
 from app.domain.value_objects.budget_category import BudgetCategory
 
 
+pytestmark = pytest.mark.unit
+
+
+# Shared amounts (parsed once per module)
+_EXPENSE_50 = Decimal("-50.00")
+_EXPENSE_100 = Decimal("-100.00")
+_INCOME_1000 = Decimal("1000.00")
+
+_TRANSACTION_DEFAULTS = dict(
+    id=1,
+    user_id=1,
+    amount=_EXPENSE_50,
+    currency="UAH",
+    description="Test",
+    category=BudgetCategory.NEEDS,
+    transaction_type=TransactionType.EXPENSE,
+    source=TransactionSource.MANUAL
+)
+
+
+@pytest.fixture(name="make_transaction")
+def make_transaction_fixture():
+    """Factory for a manual NEEDS expense; keyword arguments override fields."""
+    def make_transaction(**overrides) -> Transaction:
+        return Transaction(**{**_TRANSACTION_DEFAULTS, **overrides})
+    return make_transaction
+
+
+# (factory overrides, expected flags/absolute amount)
+_FLAG_CASES = [
+    pytest.param(
+        dict(amount=_EXPENSE_100),
+        {"expense": True, "income": False, "manual": True, "bank": False, "abs_amount": Decimal("100.00")},
+        id="manual_expense"
+    ),
+    pytest.param(
+        dict(
+            amount=_INCOME_1000,
+            description="Salary",
+            category=BudgetCategory.SAVINGS,
+            transaction_type=TransactionType.INCOME
+        ),
+        {"expense": False, "income": True, "manual": True, "bank": False, "abs_amount": _INCOME_1000},
+        id="manual_income"
+    ),
+    pytest.param(
+        dict(
+            amount=Decimal("-150.50"),
+            description="Card payment",
+            category=BudgetCategory.WANTS,
+            source=TransactionSource.MONOBANK,
+            mono_transaction_id="mono_123"
+        ),
+        {"expense": True, "income": False, "manual": False, "bank": True, "abs_amount": Decimal("150.50")},
+        id="monobank_expense"
+    ),
+    pytest.param(
+        dict(
+            amount=_INCOME_1000,
+            description="Refund",
+            transaction_type="INCOME",
+            source="MONOBANK",
+            mono_transaction_id="mono_456"
+        ),
+        {"expense": False, "income": True, "manual": False, "bank": True, "abs_amount": _INCOME_1000},
+        id="str_values_monobank_income"
+    ),
+]
+
+
 class TestTransactionEntity:
     """Test Transaction domain entity business logic."""
     
-    def test_transaction_creation(self):
+    def test_transaction_creation(self, make_transaction):
         """Test basic transaction creation."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
-            description="Groceries",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
+        transaction = make_transaction(description="Groceries")
         
         assert transaction.id == 1
-        assert transaction.amount == Decimal("-50.00")
+        assert transaction.amount == _EXPENSE_50
         assert transaction.category == BudgetCategory.NEEDS
     
-    def test_expense_is_expense(self):
-        """Test that expense transaction is identified correctly."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-100.00"),
-            currency="UAH",
-            description="Test",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
-        
-        assert transaction.is_expense() is True
-        assert transaction.is_income() is False
-    
-    def test_income_is_income(self):
-        """Test that income transaction is identified correctly."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("1000.00"),
-            currency="UAH",
-            description="Salary",
-            category=BudgetCategory.SAVINGS,
-            transaction_type=TransactionType.INCOME,
-            source=TransactionSource.MANUAL
-        )
-        
-        assert transaction.is_income() is True
-        assert transaction.is_expense() is False
-    
-    def test_manual_transaction_is_manual(self):
-        """Test manual transaction identification."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
-            description="Cash",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
-        
-        assert transaction.is_manual() is True
-        assert transaction.is_from_bank() is False
-    
-    def test_monobank_transaction_is_from_bank(self):
-        """Test Monobank transaction identification."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
-            description="Card payment",
-            category=BudgetCategory.WANTS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MONOBANK,
-            mono_transaction_id="mono_123"
-        )
-        
-        assert transaction.is_from_bank() is True
-        assert transaction.is_manual() is False
+    @pytest.mark.parametrize("overrides, expected", _FLAG_CASES)
+    def test_transaction_flags(self, make_transaction, overrides, expected):
+        """Test type/source identification and absolute amount."""
+        transaction = make_transaction(**overrides)
+        
+        assert transaction.is_expense() is expected["expense"]
+        assert transaction.is_income() is expected["income"]
+        assert transaction.is_manual() is expected["manual"]
+        assert transaction.is_from_bank() is expected["bank"]
+        assert transaction.get_absolute_amount() == expected["abs_amount"]
     
-    def test_soft_delete(self):
+    def test_soft_delete(self, make_transaction):
         """Test soft delete functionality."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
-            description="Test",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
+        transaction = make_transaction()
         
         assert transaction.is_deleted() is False
         assert transaction.deleted_at is None
@@ -118,18 +116,9 @@ class TestTransactionEntity:
         assert transaction.is_deleted() is True
         assert transaction.deleted_at is not None
     
-    def test_restore_deleted_transaction(self):
+    def test_restore_deleted_transaction(self, make_transaction):
         """Test restoring soft-deleted transaction."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
-            description="Test",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
+        transaction = make_transaction()
         
         transaction.soft_delete()
         assert transaction.is_deleted() is True
@@ -138,45 +127,11 @@ class TestTransactionEntity:
         assert transaction.is_deleted() is False
         assert transaction.deleted_at is None
     
-    def test_get_absolute_amount(self):
-        """Test getting absolute value of amount."""
-        expense = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-150.50"),
-            currency="UAH",
-            description="Expense",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
-        
-        assert expense.get_absolute_amount() == Decimal("150.50")
-        
-        income = Transaction(
-            id=2,
-            user_id=1,
-            amount=Decimal("1000.00"),
-            currency="UAH",
-            description="Income",
-            category=BudgetCategory.SAVINGS,
-            transaction_type=TransactionType.INCOME,
-            source=TransactionSource.MANUAL
-        )
-        
-        assert income.get_absolute_amount() == Decimal("1000.00")
-    
-    def test_ai_categorization(self):
+    def test_ai_categorization(self, make_transaction):
         """Test AI categorization."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
+        transaction = make_transaction(
             description="ATB Market",
             category=BudgetCategory.WANTS,  # Initially wrong
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL,
             is_ai_categorized=False
         )
         
@@ -187,17 +142,10 @@ class TestTransactionEntity:
         assert transaction.category == BudgetCategory.NEEDS
         assert transaction.is_ai_categorized is True
     
-    def test_manual_recategorization(self):
+    def test_manual_recategorization(self, make_transaction):
         """Test manual category change."""
-        transaction = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-50.00"),
-            currency="UAH",
+        transaction = make_transaction(
             description="Restaurant",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL,
             is_ai_categorized=True  # Was AI categorized
         )
         
@@ -206,34 +154,59 @@ class TestTransactionEntity:
         assert transaction.category == BudgetCategory.WANTS
         assert transaction.is_ai_categorized is False
     
-    def test_string_representation(self):
-        """Test __str__ method."""
-        expense = Transaction(
-            id=1,
-            user_id=1,
-            amount=Decimal("-100.00"),
-            currency="UAH",
-            description="Groceries",
-            category=BudgetCategory.NEEDS,
-            transaction_type=TransactionType.EXPENSE,
-            source=TransactionSource.MANUAL
-        )
+    @pytest.mark.parametrize("overrides, must_contain", [
+        (dict(amount=_EXPENSE_100, description="Groceries"), ["-100", "UAH", "Groceries"]),
+        (
+            dict(
+                amount=_INCOME_1000,
+                description="Salary",
+                category=BudgetCategory.SAVINGS,
+                transaction_type=TransactionType.INCOME
+            ),
+            ["+1000", "UAH", "Salary"]
+        ),
+        (dict(amount=_INCOME_1000, description="Salary", transaction_type="INCOME"), ["+1000"]),
+    ], ids=["expense", "income", "income_from_str"])
+    def test_string_representation(self, make_transaction, overrides, must_contain):
+        """Test __str__ method (sign, amount, currency, description)."""
+        result = str(make_transaction(**overrides))
+        
+        for part in must_contain:
+            assert part in result
+    
+    def test_str_type_and_source_are_coerced_to_members(self, make_transaction):
+        """Test plain str type/source values become enum members."""
+        transaction = make_transaction(transaction_type="INCOME", source="MONOBANK")
         
-        result = str(expense)
-        assert "-100" in result
-        assert "UAH" in result
-        assert "Groceries" in result
+        assert transaction.transaction_type is TransactionType.INCOME
+        assert transaction.source is TransactionSource.MONOBANK
+    
+    def test_flags_follow_type_and_source_changes(self, make_transaction):
+        """Test reassigning type/source (enum or str) updates the cached flags."""
+        transaction = make_transaction()
         
-        income = Transaction(
-            id=2,
-            user_id=1,
-            amount=Decimal("1000.00"),
-            currency="UAH",
-            description="Salary",
-            category=BudgetCategory.SAVINGS,
-            transaction_type=TransactionType.INCOME,
-            source=TransactionSource.MANUAL
+        transaction.transaction_type = TransactionType.INCOME
+        transaction.source = "MONOBANK"
+        
+        assert transaction.is_income() is True
+        assert transaction.is_expense() is False
+        assert transaction.is_from_bank() is True
+        assert transaction.is_manual() is False
+        assert transaction.source is TransactionSource.MONOBANK
+    
+    def test_cached_flags_survive_recategorization(self, make_transaction):
+        """Test precomputed type/source flags are unaffected by category changes."""
+        transaction = make_transaction(
+            amount=Decimal("-250.00"),
+            description="Cinema",
+            source=TransactionSource.MONOBANK
         )
         
-        result = str(income)
-        assert "+1000" in result or "1000" in result
+        transaction.categorize_with_ai(BudgetCategory.WANTS)
+        transaction.manually_recategorize(BudgetCategory.SAVINGS)
+        
+        assert transaction.is_expense() is True
+        assert transaction.is_income() is False
+        assert transaction.is_from_bank() is True
+        assert transaction.is_manual() is False
+        assert "_is_income" not in repr(transaction)
@@ -9,6 +9,9 @@ from app.domain.entities.user import User
 from app.domain.value_objects.tracking_mode import TrackingMode
 
 
+pytestmark = pytest.mark.unit
+
+
 class TestUserEntity:
     """Test User domain entity business logic."""
     
@@ -162,3 +165,16 @@ class TestUserEntity:
         assert "42" in result
         assert "test@example.com" in result
         assert "True" in result
+    
+    def test_user_has_no_instance_dict(self):
+        """Test entity uses __slots__ (no per-instance __dict__)."""
+        user = User(
+            id=1,
+            email="test@example.com",
+            tracking_mode=TrackingMode.MANUAL,
+            is_premium=False
+        )
+        
+        assert not hasattr(user, "__dict__")
+        with pytest.raises(AttributeError):
+            user.unknown_attribute = "value"
@@ -0,0 +1,69 @@
+"""
+Unit tests for vectorized budget rollups.
+Checks that NumPy results agree with the Decimal-based Budget entity.
+"""
+import pytest
+import numpy as np
+from datetime import datetime, timezone, date
+from decimal import Decimal
+
+from app.domain.entities.budget import Budget
+from app.domain.services.budget_bulk import bulk_rollup, to_decimals
+from app.domain.value_objects.budget_category import BudgetCategory
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestBulkRollup:
+    """Test bulk_rollup against the single-budget Decimal API."""
+    
+    def test_matches_budget_entity(self):
+        """Allocations, remainders and progress should match Budget."""
+        incomes = np.array([30000.0, 45250.50])
+        spent = np.array([
+            [3000.0, 9500.0, 0.0],
+            [22625.25, 100.0, 50.0],
+        ])
+        
+        allocated, remaining, pct = bulk_rollup(incomes, spent)
+        
+        categories = (BudgetCategory.NEEDS, BudgetCategory.WANTS, BudgetCategory.SAVINGS)
+        for row, income in enumerate(incomes):
+            income_dec = Decimal(repr(float(income)))
+            budget = Budget(
+                id=None,
+                user_id=1,
+                monthly_income=income_dec,
+                period_start_date=date(2026, 1, 1),
+                period_end_date=date(2026, 1, 31),
+                needs_allocated=Decimal(0),
+                wants_allocated=Decimal(0),
+                savings_allocated=Decimal(0),
+                created_at=datetime.now(timezone.utc)
+            )
+            budget.needs_allocated, budget.wants_allocated, budget.savings_allocated = (
+                budget.calculate_50_30_20()
+            )
+            
+            assert to_decimals(allocated[row]) == list(budget.calculate_50_30_20())
+            for col, category in enumerate(categories):
+                spent_dec = Decimal(repr(float(spent[row, col])))
+                assert to_decimals([remaining[row, col]]) == [
+                    budget.get_remaining_budget(category, spent_dec)
+                ]
+                assert to_decimals([pct[row, col]]) == [
+                    budget.get_progress_percentage(category, spent_dec)
+                ]
+    
+    def test_zero_income_has_zero_progress(self):
+        """Progress should be 0 where nothing is allocated."""
+        _, remaining, pct = bulk_rollup(np.array([0.0]), np.array([[10.0, 0.0, 0.0]]))
+        
+        assert pct.tolist() == [[0.0, 0.0, 0.0]]
+        assert remaining.tolist() == [[-10.0, 0.0, 0.0]]
+    
+    def test_shape_mismatch_raises(self):
+        """spent must be (N, 3)."""
+        with pytest.raises(ValueError, match="spent must have shape"):
+            bulk_rollup(np.array([1000.0, 2000.0]), np.array([[1.0, 2.0, 3.0]]))
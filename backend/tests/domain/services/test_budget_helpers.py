@@ -0,0 +1,27 @@
+"""
+Unit tests for budget period helpers.
+"""
+import pytest
+from datetime import date
+
+from app.domain.services.budget_helpers import get_month_period, get_current_month_period
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestMonthPeriod:
+    """Test month period calculation."""
+    
+    def test_leap_february(self):
+        """February in a leap year has 29 days."""
+        assert get_month_period(2028, 2) == (date(2028, 2, 1), date(2028, 2, 29))
+    
+    def test_regular_february(self):
+        """February in a common year has 28 days."""
+        assert get_month_period(2026, 2) == (date(2026, 2, 1), date(2026, 2, 28))
+    
+    def test_current_month_matches_month_period(self):
+        """Current period should equal the explicit period for today."""
+        today = date.today()
+        assert get_current_month_period() == get_month_period(today.year, today.month)
@@ -0,0 +1,26 @@
+"""
+Unit tests for BudgetCategory value object.
+"""
+import pytest
+
+from app.domain.value_objects.budget_category import BudgetCategory
+
+
+pytestmark = pytest.mark.unit
+
+
+class TestBudgetCategory:
+    """Test 50/30/20 percentages and essential flag."""
+    
+    def test_budget_percentages(self):
+        """Percentages follow the 50/30/20 rule and sum to 100."""
+        assert BudgetCategory.NEEDS.get_budget_percentage() == 50
+        assert BudgetCategory.WANTS.get_budget_percentage() == 30
+        assert BudgetCategory.SAVINGS.get_budget_percentage() == 20
+        assert sum(c.get_budget_percentage() for c in BudgetCategory) == 100
+    
+    def test_only_needs_is_essential(self):
+        """Only NEEDS is an essential category."""
+        assert BudgetCategory.NEEDS.is_essential() is True
+        assert BudgetCategory.WANTS.is_essential() is False
+        assert BudgetCategory.SAVINGS.is_essential() is False
@@ -5,6 +5,9 @@ import pytest
 from app.domain.value_objects.category import Category, BudgetType
 
 
+pytestmark = pytest.mark.unit
+
+
 class TestCategoryBasics:
     """Test basic Category enum functionality."""
     
@@ -25,29 +28,29 @@ class TestCategoryBasics:
 class TestBudgetTypeMapping:
     """Test budget type classification."""
     
-    def test_needs_categories_return_needs_budget_type(self):
-        """NEEDS categories should return BudgetType.NEEDS."""
-        assert Category.GROCERIES.get_budget_type() == BudgetType.NEEDS
-        assert Category.HOUSING.get_budget_type() == BudgetType.NEEDS
-        assert Category.UTILITIES.get_budget_type() == BudgetType.NEEDS
-        assert Category.TRANSPORT.get_budget_type() == BudgetType.NEEDS
-        assert Category.INSURANCE.get_budget_type() == BudgetType.NEEDS
-        assert Category.HEALTHCARE.get_budget_type() == BudgetType.NEEDS
-    
-    def test_wants_categories_return_wants_budget_type(self):
-        """WANTS categories should return BudgetType.WANTS."""
-        assert Category.RESTAURANTS.get_budget_type() == BudgetType.WANTS
-        assert Category.ENTERTAINMENT.get_budget_type() == BudgetType.WANTS
-        assert Category.SHOPPING.get_budget_type() == BudgetType.WANTS
-        assert Category.HOBBIES.get_budget_type() == BudgetType.WANTS
-        assert Category.TRAVEL.get_budget_type() == BudgetType.WANTS
-        assert Category.BEAUTY.get_budget_type() == BudgetType.WANTS
-    
-    def test_savings_categories_return_savings_budget_type(self):
-        """SAVINGS categories should return BudgetType.SAVINGS."""
-        assert Category.SAVINGS_ACCOUNT.get_budget_type() == BudgetType.SAVINGS
-        assert Category.INVESTMENTS.get_budget_type() == BudgetType.SAVINGS
-        assert Category.DEBT_REPAYMENT.get_budget_type() == BudgetType.SAVINGS
+    @pytest.mark.parametrize("category, budget_type", [
+        # NEEDS
+        (Category.GROCERIES, BudgetType.NEEDS),
+        (Category.HOUSING, BudgetType.NEEDS),
+        (Category.UTILITIES, BudgetType.NEEDS),
+        (Category.TRANSPORT, BudgetType.NEEDS),
+        (Category.INSURANCE, BudgetType.NEEDS),
+        (Category.HEALTHCARE, BudgetType.NEEDS),
+        # WANTS
+        (Category.RESTAURANTS, BudgetType.WANTS),
+        (Category.ENTERTAINMENT, BudgetType.WANTS),
+        (Category.SHOPPING, BudgetType.WANTS),
+        (Category.HOBBIES, BudgetType.WANTS),
+        (Category.TRAVEL, BudgetType.WANTS),
+        (Category.BEAUTY, BudgetType.WANTS),
+        # SAVINGS
+        (Category.SAVINGS_ACCOUNT, BudgetType.SAVINGS),
+        (Category.INVESTMENTS, BudgetType.SAVINGS),
+        (Category.DEBT_REPAYMENT, BudgetType.SAVINGS),
+    ])
+    def test_category_returns_its_budget_type(self, category, budget_type):
+        """Each spending category maps to its NEEDS/WANTS/SAVINGS budget type."""
+        assert category.get_budget_type() == budget_type
     
     def test_income_category_returns_none(self):
         """INCOME category doesn't belong to any budget type."""
@@ -58,64 +61,84 @@ class TestBudgetTypeMapping:
         assert Category.OTHER.get_budget_type() == BudgetType.WANTS
 
 
+@pytest.fixture(scope="module")
+def category_buckets():
+    """Categories per budget type, loaded once for the filtering tests."""
+    return {
+        BudgetType.NEEDS: Category.get_needs_categories(),
+        BudgetType.WANTS: Category.get_wants_categories(),
+        BudgetType.SAVINGS: Category.get_savings_categories()
+    }
+
+
 class TestCategoryFiltering:
     """Test filtering categories by budget type."""
     
-    def test_get_needs_categories(self):
-        """Should return all NEEDS categories."""
-        needs = Category.get_needs_categories()
+    @pytest.mark.parametrize("budget_type, expected_len, must_have, must_not_have", [
+        (
+            BudgetType.NEEDS,
+            6,
+            [Category.GROCERIES, Category.HOUSING, Category.UTILITIES,
+             Category.TRANSPORT, Category.INSURANCE, Category.HEALTHCARE],
+            [Category.RESTAURANTS, Category.SAVINGS_ACCOUNT]
+        ),
+        (
+            BudgetType.WANTS,
+            7,  # Including OTHER
+            [Category.RESTAURANTS, Category.ENTERTAINMENT, Category.SHOPPING,
+             Category.HOBBIES, Category.TRAVEL, Category.BEAUTY, Category.OTHER],
+            [Category.GROCERIES, Category.SAVINGS_ACCOUNT]
+        ),
+        (
+            BudgetType.SAVINGS,
+            3,
+            [Category.SAVINGS_ACCOUNT, Category.INVESTMENTS, Category.DEBT_REPAYMENT],
+            [Category.GROCERIES, Category.RESTAURANTS]
+        ),
+    ])
+    def test_get_categories_by_budget_type(
+        self, category_buckets, budget_type, expected_len, must_have, must_not_have
+    ):
+        """Each budget type returns exactly its own categories."""
+        bucket = category_buckets[budget_type]
         
-        assert len(needs) == 6
-        assert Category.GROCERIES in needs
-        assert Category.HOUSING in needs
-        assert Category.UTILITIES in needs
-        assert Category.TRANSPORT in needs
-        assert Category.INSURANCE in needs
-        assert Category.HEALTHCARE in needs
+        assert len(bucket) == expected_len
+        for category in must_have:
+            assert category in bucket
+        for category in must_not_have:
+            assert category not in bucket
         
-        # Should NOT contain WANTS or SAVINGS
-        assert Category.RESTAURANTS not in needs
-        assert Category.SAVINGS_ACCOUNT not in needs
-    
-    def test_get_wants_categories(self):
-        """Should return all WANTS categories."""
-        wants = Category.get_wants_categories()
-        
-        assert len(wants) == 7  # Including OTHER
-        assert Category.RESTAURANTS in wants
-        assert Category.ENTERTAINMENT in wants
-        assert Category.SHOPPING in wants
-        assert Category.HOBBIES in wants
-        assert Category.TRAVEL in wants
-        assert Category.BEAUTY in wants
-        assert Category.OTHER in wants
+        # Generic method agrees with the per-type helpers
+        assert Category.get_all_by_budget_type(budget_type) == bucket
+    
+    def test_category_sets_match_tuples(self, category_buckets):
+        """Frozenset view has the same members as the ordered tuple."""
+        for budget_type, bucket in category_buckets.items():
+            category_set = Category.get_set_by_budget_type(budget_type)
+            
+            assert isinstance(category_set, frozenset)
+            assert category_set == frozenset(bucket)
         
-        # Should NOT contain NEEDS or SAVINGS
-        assert Category.GROCERIES not in wants
-        assert Category.SAVINGS_ACCOUNT not in wants
-    
-    def test_get_savings_categories(self):
-        """Should return all SAVINGS categories."""
-        savings = Category.get_savings_categories()
-        
-        assert len(savings) == 3
-        assert Category.SAVINGS_ACCOUNT in savings
-        assert Category.INVESTMENTS in savings
-        assert Category.DEBT_REPAYMENT in savings
-        
-        # Should NOT contain NEEDS or WANTS
-        assert Category.GROCERIES not in savings
-        assert Category.RESTAURANTS not in savings
-    
-    def test_get_all_by_budget_type(self):
-        """Generic method should work for any budget type."""
-        needs = Category.get_all_by_budget_type(BudgetType.NEEDS)
-        wants = Category.get_all_by_budget_type(BudgetType.WANTS)
-        savings = Category.get_all_by_budget_type(BudgetType.SAVINGS)
+        assert Category.GROCERIES in Category.get_set_by_budget_type(BudgetType.NEEDS)
+        assert Category.GROCERIES not in Category.get_set_by_budget_type(BudgetType.WANTS)
+    
+    def test_budget_type_predicates(self):
+        """is_needs/is_wants/is_savings follow the budget type mapping."""
+        assert Category.GROCERIES.is_needs()
+        assert not Category.GROCERIES.is_wants()
+        assert Category.OTHER.is_wants()
+        assert Category.INVESTMENTS.is_savings()
+        assert not Category.INCOME.is_needs()
+        assert not Category.INCOME.is_wants()
+        assert not Category.INCOME.is_savings()
+    
+    def test_filtered_categories_are_cached_tuples(self):
+        """Repeated calls should return the same immutable tuple."""
+        first = Category.get_needs_categories()
+        second = Category.get_all_by_budget_type(BudgetType.NEEDS)
         
-        assert len(needs) == 6
-        assert len(wants) == 7
-        assert len(savings) == 3
+        assert isinstance(first, tuple)
+        assert first is second
 
 
 class TestCategoryMetadata:
@@ -137,11 +160,14 @@ class TestCategoryMetadata:
     
     def test_all_categories_have_metadata(self):
         """Every category must have display name and icon."""
-        for category in Category:
-            assert category.display_name_ua is not None
-            assert category.icon is not None
-            assert isinstance(category.display_name_ua, str)
-            assert isinstance(category.icon, str)
+        missing = [
+            category for category in Category
+            if not (
+                isinstance(category.display_name_ua, str) and category.display_name_ua
+                and isinstance(category.icon, str) and category.icon
+            )
+        ]
+        assert not missing, f"Missing metadata: {missing}"
 
 
 class TestCategoryBusinessLogic:
@@ -6,119 +6,97 @@ import pytest
 from decimal import Decimal
 from datetime import datetime, timezone, date
 from sqlmodel import Session, select
+from sqlalchemy import bindparam, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from pydantic import ValidationError
 
 from app.infrastructure.persistence.budget_model import BudgetModel
 from app.infrastructure.persistence.user_model import UserModel
 
 
+# Shared amounts (parsed once per module)
+_INCOME = Decimal('30000.00')
+_NEEDS_ALLOCATED = Decimal('15000.00')
+_WANTS_ALLOCATED = Decimal('9000.00')
+_SAVINGS_ALLOCATED = Decimal('6000.00')
+_ZERO = Decimal('0.00')
+
+# Lookup by primary key, built once; bind "id" per call
+_SELECT_BUDGET_BY_ID = select(BudgetModel).where(BudgetModel.id == bindparam("id"))
+
+# Valid January 2026 budget; validation tests override single fields
+_BASE_BUDGET = dict(
+    user_id=1,
+    monthly_income=_INCOME,
+    needs_allocated=_NEEDS_ALLOCATED,
+    wants_allocated=_WANTS_ALLOCATED,
+    savings_allocated=_SAVINGS_ALLOCATED,
+    period_start_date=date(2026, 1, 1),
+    period_end_date=date(2026, 1, 31)
+)
+
+
+@pytest.mark.db
 class TestBudgetModel:
-    """Test BudgetModel database operations and validation."""
+    """Test BudgetModel database operations and constraints."""
     
-    def test_create_budget_in_database(self, session: Session):
+    def test_create_budget_in_database(self, session: Session, user: UserModel):
         """Test creating a budget and persisting to database."""
-        # First create a user
-        user = UserModel(
-            email="budget@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         # Create budget
         budget = BudgetModel(
             user_id=user.id,
-            monthly_income=Decimal('30000.00'),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
+            monthly_income=_INCOME,
+            needs_allocated=_NEEDS_ALLOCATED,
+            wants_allocated=_WANTS_ALLOCATED,
+            savings_allocated=_SAVINGS_ALLOCATED,
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
         
         session.add(budget)
-        session.commit()
-        session.refresh(budget)
+        session.flush()
         
         assert budget.id is not None
         assert budget.user_id == user.id
-        assert budget.monthly_income == Decimal('30000.00')
-    
-    def test_negative_income_raises_validation_error(self):
-        """Test that income must be positive."""
-        with pytest.raises(ValidationError, match="Monthly income must be positive"):
-            BudgetModel(
-                user_id=1,
-                monthly_income=Decimal('-1000.00'),
-                needs_allocated=Decimal('15000.00'),
-                wants_allocated=Decimal('9000.00'),
-                savings_allocated=Decimal('6000.00'),
-                period_start_date=date(2026, 1, 1),
-                period_end_date=date(2026, 1, 31)
-            )
-    
-    def test_zero_income_raises_validation_error(self):
-        """Test that income cannot be zero."""
-        with pytest.raises(ValidationError, match="Monthly income must be positive"):
-            BudgetModel(
-                user_id=1,
-                monthly_income=Decimal('0.00'),
-                needs_allocated=Decimal('0.00'),
-                wants_allocated=Decimal('0.00'),
-                savings_allocated=Decimal('0.00'),
-                period_start_date=date(2026, 1, 1),
-                period_end_date=date(2026, 1, 31)
-            )
+        assert budget.monthly_income == _INCOME
     
-    def test_period_end_before_start_raises_error(self):
-        """Test that period_end_date must be after period_start_date."""
-        with pytest.raises(ValidationError, match="Period end must be after period start"):
-            BudgetModel(
-                user_id=1,
-                monthly_income=Decimal('30000.00'),
-                needs_allocated=Decimal('15000.00'),
-                wants_allocated=Decimal('9000.00'),
-                savings_allocated=Decimal('6000.00'),
-                period_start_date=date(2026, 1, 31),
-                period_end_date=date(2026, 1, 1)  # Before start!
-            )
-    
-    def test_allocated_sum_validation(self):
-        """Test that allocated amounts must sum to income."""
-        with pytest.raises(ValidationError, match="must sum to monthly income"):
-            BudgetModel(
-                user_id=1,
-                monthly_income=Decimal('30000.00'),
-                needs_allocated=Decimal('10000.00'),  # Sum = 25000
-                wants_allocated=Decimal('10000.00'),
-                savings_allocated=Decimal('5000.00'),  # Not 30000!
-                period_start_date=date(2026, 1, 1),
-                period_end_date=date(2026, 1, 31)
-            )
-    
-    def test_unique_constraint_user_period(self, session: Session):
-        """Test unique constraint on (user_id, period_start_date)."""
-        user = UserModel(
-            email="unique@example.com",
-            password_hash="$2b$12$" + "x" * 50
+    def test_money_stored_as_integer_cents(self, session: Session, user: UserModel):
+        """Test amounts are persisted as integer cents and read back as Decimal."""
+        budget = BudgetModel(
+            user_id=user.id,
+            monthly_income=Decimal('30000.55'),
+            needs_allocated=Decimal('15000.28'),
+            wants_allocated=Decimal('9000.16'),
+            savings_allocated=Decimal('6000.11'),
+            period_start_date=date(2026, 1, 1),
+            period_end_date=date(2026, 1, 31)
         )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
+        session.add(budget)
+        session.flush()
+        
+        raw = session.exec(text("SELECT monthly_income FROM budgets")).one()
+        assert raw[0] == 3000055
         
+        session.expire_all()
+        loaded = session.get(BudgetModel, budget.id)
+        assert loaded.monthly_income == Decimal('30000.55')
+        assert loaded.needs_allocated == Decimal('15000.28')
+    
+    def test_unique_constraint_user_period(self, session: Session, user: UserModel):
+        """Test unique constraint on (user_id, period_start_date)."""
         # First budget
         budget1 = BudgetModel(
             user_id=user.id,
-            monthly_income=Decimal('30000.00'),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
+            monthly_income=_INCOME,
+            needs_allocated=_NEEDS_ALLOCATED,
+            wants_allocated=_WANTS_ALLOCATED,
+            savings_allocated=_SAVINGS_ALLOCATED,
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
         session.add(budget1)
-        session.commit()
+        session.flush()
         
         # Try to create another for same period
         budget2 = BudgetModel(
@@ -130,28 +108,19 @@ class TestBudgetModel:
             period_start_date=date(2026, 1, 1),  # Same period!
             period_end_date=date(2026, 1, 31)
         )
-        session.add(budget2)
-        
-        with pytest.raises(Exception):  # IntegrityError
-            session.commit()
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(budget2)
+            session.flush()
     
-    def test_user_relationship(self, session: Session):
+    def test_user_relationship(self, session: Session, user: UserModel):
         """Test relationship between User and Budget."""
-        user = UserModel(
-            email="relation@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         # Create budgets for different months
         b1 = BudgetModel(
             user_id=user.id,
-            monthly_income=Decimal('30000.00'),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
+            monthly_income=_INCOME,
+            needs_allocated=_NEEDS_ALLOCATED,
+            wants_allocated=_WANTS_ALLOCATED,
+            savings_allocated=_SAVINGS_ALLOCATED,
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
@@ -166,76 +135,97 @@ class TestBudgetModel:
         )
         
         session.add_all([b1, b2])
-        session.commit()
+        session.flush()
         
-        # Refresh user to load budgets
-        session.refresh(user)
+        # Collection loaded from the DB in one SELECT ... IN, no lazy load
+        statement = (
+            select(UserModel)
+            .options(selectinload(UserModel.budgets))
+            .where(UserModel.id == user.id)
+        )
+        loaded = session.exec(statement).one()
         
-        assert len(user.budgets) == 2
+        assert len(loaded.budgets) == 2
+        assert {budget.id for budget in loaded.budgets} == {b1.id, b2.id}
     
-    def test_cascade_delete(self, session: Session):
+    def test_cascade_delete(self, session: Session, user: UserModel):
         """Test that deleting user deletes budgets."""
-        user = UserModel(
-            email="cascade@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         budget = BudgetModel(
             user_id=user.id,
-            monthly_income=Decimal('30000.00'),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
+            monthly_income=_INCOME,
+            needs_allocated=_NEEDS_ALLOCATED,
+            wants_allocated=_WANTS_ALLOCATED,
+            savings_allocated=_SAVINGS_ALLOCATED,
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
         session.add(budget)
-        session.commit()
+        session.flush()
         
         budget_id = budget.id
         
         # Delete user
         session.delete(user)
-        session.commit()
+        session.flush()
         
         # Verify budget is also deleted
-        statement = select(BudgetModel).where(BudgetModel.id == budget_id)
-        result = session.exec(statement).first()
+        result = session.exec(_SELECT_BUDGET_BY_ID, params={"id": budget_id}).first()
         
         assert result is None
+
+
+class TestBudgetValidation:
+    """Test BudgetModel validators and helpers (no database)."""
+    
+    @pytest.mark.parametrize("override, match", [
+        ({"monthly_income": Decimal('-1000.00')}, "Monthly income must be positive"),
+        (
+            {
+                "monthly_income": _ZERO,
+                "needs_allocated": _ZERO,
+                "wants_allocated": _ZERO,
+                "savings_allocated": _ZERO
+            },
+            "Monthly income must be positive"
+        ),
+        (
+            {"period_start_date": date(2026, 1, 31), "period_end_date": date(2026, 1, 1)},
+            "Period end must be after period start"
+        ),
+        (
+            {"needs_allocated": Decimal('10000.00'), "wants_allocated": Decimal('10000.00'), "savings_allocated": Decimal('5000.00')},
+            "must sum to monthly income"  # Sum = 25000, not 30000
+        ),
+    ], ids=["negative_income", "zero_income", "period_end_before_start", "allocated_sum"])
+    def test_invalid_budget_raises_validation_error(self, override, match):
+        """Test income, period and 50/30/20 sum validation."""
+        with pytest.raises(ValidationError, match=match):
+            BudgetModel(**{**_BASE_BUDGET, **override})
     
     def test_50_30_20_calculation(self):
         """Test that 50/30/20 allocation is correct."""
-        income = Decimal('30000.00')
-        needs = (income * Decimal('0.50')).quantize(Decimal('0.01'))
-        wants = (income * Decimal('0.30')).quantize(Decimal('0.01'))
-        savings = (income * Decimal('0.20')).quantize(Decimal('0.01'))
-        
         budget = BudgetModel(
             user_id=1,
-            monthly_income=income,
-            needs_allocated=needs,
-            wants_allocated=wants,
-            savings_allocated=savings,
+            monthly_income=_INCOME,
+            needs_allocated=Decimal('15000.00'),  # 50% of 30000
+            wants_allocated=Decimal('9000.00'),  # 30%
+            savings_allocated=Decimal('6000.00'),  # 20%
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
         
-        assert budget.needs_allocated == Decimal('15000.00')
-        assert budget.wants_allocated == Decimal('9000.00')
-        assert budget.savings_allocated == Decimal('6000.00')
+        assert budget.needs_allocated == _NEEDS_ALLOCATED
+        assert budget.wants_allocated == _WANTS_ALLOCATED
+        assert budget.savings_allocated == _SAVINGS_ALLOCATED
     
     def test_budget_repr(self):
         """Test __repr__ method."""
         budget = BudgetModel(
             user_id=1,
-            monthly_income=Decimal('30000.00'),
-            needs_allocated=Decimal('15000.00'),
-            wants_allocated=Decimal('9000.00'),
-            savings_allocated=Decimal('6000.00'),
+            monthly_income=_INCOME,
+            needs_allocated=_NEEDS_ALLOCATED,
+            wants_allocated=_WANTS_ALLOCATED,
+            savings_allocated=_SAVINGS_ALLOCATED,
             period_start_date=date(2026, 1, 1),
             period_end_date=date(2026, 1, 31)
         )
@@ -6,34 +6,44 @@ import pytest
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
 from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from pydantic import ValidationError
 
 from app.infrastructure.persistence.transaction_model import (
     TransactionModel,
+    TransactionRead,
     TransactionTypeEnum,
     TransactionSourceEnum,
-    BudgetCategoryEnum
+    BudgetCategoryEnum,
+    validate_transactions
 )
 from app.infrastructure.persistence.user_model import UserModel
 
 
+# Reused across tests (one cached compile); bind "id" per call
+_SELECT_TRANSACTION_BY_ID = select(TransactionModel).where(TransactionModel.id == bindparam("id"))
+
+# Minimal valid transaction; field tests add single overrides
+_BASE_TRANSACTION = dict(
+    user_id=1,
+    amount=Decimal("-50.00"),
+    description="Test",
+    category=BudgetCategoryEnum.NEEDS,
+    transaction_type=TransactionTypeEnum.EXPENSE
+)
+
+
+@pytest.mark.db
 class TestTransactionModel:
-    """Test TransactionModel database operations and validation."""
+    """Test TransactionModel database operations and constraints."""
     
-    def test_create_transaction_in_database(self, session: Session):
+    def test_create_transaction_in_database(self, session: Session, persistent_user: UserModel):
         """Test creating a transaction and persisting to database."""
-        # First create a user
-        user = UserModel(
-            email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         # Create transaction
         transaction = TransactionModel(
-            user_id=user.id,
+            user_id=persistent_user.id,
             amount=Decimal("-100.50"),
             currency="UAH",
             description="Groceries at ATB",
@@ -42,223 +52,104 @@ class TestTransactionModel:
         )
         
         session.add(transaction)
-        session.commit()
-        session.refresh(transaction)
+        session.flush()
         
         assert transaction.id is not None
-        assert transaction.user_id == user.id
+        assert transaction.user_id == persistent_user.id
         assert transaction.amount == Decimal("-100.50")
         assert transaction.category == BudgetCategoryEnum.NEEDS
         assert transaction.created_at is not None
     
-    def test_zero_amount_raises_validation_error(self):
-        """Test that amount cannot be zero."""
-        with pytest.raises(ValidationError, match="Amount cannot be zero"):
-            TransactionModel(
-                user_id=1,
-                amount=Decimal("0"),
-                description="Test",
-                category=BudgetCategoryEnum.NEEDS,
-                transaction_type=TransactionTypeEnum.EXPENSE
-            )
-    
-    def test_empty_description_raises_validation_error(self):
-        """Test that description cannot be empty."""
-        with pytest.raises(ValidationError, match="Description cannot be empty"):
-            TransactionModel(
-                user_id=1,
-                amount=Decimal("-50.00"),
-                description="",
-                category=BudgetCategoryEnum.NEEDS,
-                transaction_type=TransactionTypeEnum.EXPENSE
-            )
-    
-    def test_whitespace_description_raises_validation_error(self):
-        """Test that whitespace-only description is invalid."""
-        with pytest.raises(ValidationError, match="Description cannot be empty"):
-            TransactionModel(
-                user_id=1,
-                amount=Decimal("-50.00"),
-                description="   ",
-                category=BudgetCategoryEnum.NEEDS,
-                transaction_type=TransactionTypeEnum.EXPENSE
-            )
-    
-    def test_description_strips_whitespace(self):
-        """Test that description whitespace is stripped."""
-        transaction = TransactionModel(
-            user_id=1,
-            amount=Decimal("-50.00"),
-            description="  Groceries  ",
-            category=BudgetCategoryEnum.NEEDS,
-            transaction_type=TransactionTypeEnum.EXPENSE
-        )
-        
-        assert transaction.description == "Groceries"
-    
-    def test_currency_normalized_to_uppercase(self):
-        """Test that currency is normalized to uppercase."""
-        transaction = TransactionModel(
-            user_id=1,
-            amount=Decimal("-50.00"),
-            description="Test",
-            currency="uah",
-            category=BudgetCategoryEnum.NEEDS,
-            transaction_type=TransactionTypeEnum.EXPENSE
-        )
-        
-        assert transaction.currency == "UAH"
-    
-    def test_default_currency_is_uah(self):
-        """Test that default currency is UAH."""
-        transaction = TransactionModel(
-            user_id=1,
-            amount=Decimal("-50.00"),
-            description="Test",
-            category=BudgetCategoryEnum.NEEDS,
-            transaction_type=TransactionTypeEnum.EXPENSE
-        )
-        
-        assert transaction.currency == "UAH"
-    
-    def test_default_source_is_manual(self):
-        """Test that default source is MANUAL."""
-        transaction = TransactionModel(
-            user_id=1,
-            amount=Decimal("-50.00"),
-            description="Test",
-            category=BudgetCategoryEnum.NEEDS,
-            transaction_type=TransactionTypeEnum.EXPENSE
-        )
-        
-        assert transaction.source == TransactionSourceEnum.MANUAL
-    
-    def test_default_is_ai_categorized_is_false(self):
-        """Test that default is_ai_categorized is False."""
+    def test_invalid_category_rejected_by_check_constraint(self, session: Session, persistent_user: UserModel):
+        """Test enum columns only accept known values at the DB level."""
         transaction = TransactionModel(
-            user_id=1,
-            amount=Decimal("-50.00"),
-            description="Test",
-            category=BudgetCategoryEnum.NEEDS,
+            user_id=persistent_user.id,
+            amount=Decimal("-10.00"),
+            description="Unknown",
+            category="LUXURY",
             transaction_type=TransactionTypeEnum.EXPENSE
         )
-        
-        assert transaction.is_ai_categorized is False
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(transaction)
+            session.flush()
     
-    def test_foreign_key_relationship(self, session: Session):
+    def test_foreign_key_relationship(self, session: Session, persistent_user: UserModel, bulk_create_transactions):
         """Test relationship between User and Transaction."""
-        # Create user
-        user = UserModel(
-            email="relation@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
+        income = {
+            "amount": Decimal("1000.00"),
+            "description": "Income",
+            "category": "SAVINGS",
+            "transaction_type": "INCOME"
+        }
+        bulk_create_transactions(persistent_user.id, 2, overrides=[{}, income])
         
-        # Create transactions
-        t1 = TransactionModel(
-            user_id=user.id,
-            amount=Decimal("-100.00"),
-            description="Expense 1",
-            category=BudgetCategoryEnum.NEEDS,
-            transaction_type=TransactionTypeEnum.EXPENSE
+        statement = (
+            select(UserModel)
+            .options(selectinload(UserModel.transactions))
+            .where(UserModel.id == persistent_user.id)
         )
-        t2 = TransactionModel(
-            user_id=user.id,
-            amount=Decimal("1000.00"),
-            description="Income",
-            category=BudgetCategoryEnum.SAVINGS,
-            transaction_type=TransactionTypeEnum.INCOME
-        )
-        
-        session.add_all([t1, t2])
-        session.commit()
-        
-        # Refresh user to load transactions
-        session.refresh(user)
+        user = session.exec(statement).one()
         
         assert len(user.transactions) == 2
+        assert {t.transaction_type for t in user.transactions} == {
+            TransactionTypeEnum.EXPENSE, TransactionTypeEnum.INCOME
+        }
+        assert {t.category for t in user.transactions} == {
+            BudgetCategoryEnum.NEEDS, BudgetCategoryEnum.SAVINGS
+        }
     
-    def test_cascade_delete(self, session: Session):
+    def test_cascade_delete(self, session: Session, persistent_user: UserModel):
         """Test that deleting user deletes transactions."""
-        # Create user with transaction
-        user = UserModel(
-            email="cascade@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         transaction = TransactionModel(
-            user_id=user.id,
+            user_id=persistent_user.id,
             amount=Decimal("-50.00"),
             description="Test",
             category=BudgetCategoryEnum.NEEDS,
             transaction_type=TransactionTypeEnum.EXPENSE
         )
         session.add(transaction)
-        session.commit()
+        session.flush()
         
         transaction_id = transaction.id
         
         # Delete user
-        session.delete(user)
-        session.commit()
+        session.delete(session.merge(persistent_user, load=False))
+        session.flush()
         
         # Verify transaction is also deleted
-        statement = select(TransactionModel).where(TransactionModel.id == transaction_id)
-        result = session.exec(statement).first()
+        result = session.exec(_SELECT_TRANSACTION_BY_ID, params={"id": transaction_id}).first()
         
         assert result is None
     
-    def test_soft_delete_pattern(self, session: Session):
+    def test_soft_delete_pattern(self, session: Session, persistent_user: UserModel):
         """Test soft delete with deleted_at field."""
-        # Create user
-        user = UserModel(
-            email="softdelete@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         # Create transaction
         transaction = TransactionModel(
-            user_id=user.id,
+            user_id=persistent_user.id,
             amount=Decimal("-50.00"),
             description="Test",
             category=BudgetCategoryEnum.NEEDS,
             transaction_type=TransactionTypeEnum.EXPENSE
         )
         session.add(transaction)
-        session.commit()
-        session.refresh(transaction)
+        session.flush()
         
         assert transaction.deleted_at is None
         
         # Soft delete
         transaction.deleted_at = datetime.now(timezone.utc)
         session.add(transaction)
-        session.commit()
-        session.refresh(transaction)
+        session.flush()
+        session.expire(transaction, ["deleted_at"])
         
+        # Reloaded from the row, so this checks the stored value
         assert transaction.deleted_at is not None
     
-    def test_monobank_transaction_id_unique(self, session: Session):
+    def test_monobank_transaction_id_unique(self, session: Session, persistent_user: UserModel):
         """Test that mono_transaction_id must be unique."""
-        user = UserModel(
-            email="mono@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-        
         # First transaction with mono_transaction_id
         t1 = TransactionModel(
-            user_id=user.id,
+            user_id=persistent_user.id,
             amount=Decimal("-50.00"),
             description="Test 1",
             category=BudgetCategoryEnum.NEEDS,
@@ -266,21 +157,155 @@ class TestTransactionModel:
             mono_transaction_id="mono_123"
         )
         session.add(t1)
-        session.commit()
+        session.flush()
         
         # Try to create another with same mono_transaction_id
         t2 = TransactionModel(
-            user_id=user.id,
+            user_id=persistent_user.id,
             amount=Decimal("-100.00"),
             description="Test 2",
             category=BudgetCategoryEnum.NEEDS,
             transaction_type=TransactionTypeEnum.EXPENSE,
             mono_transaction_id="mono_123"
         )
-        session.add(t2)
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(t2)
+            session.flush()
+    
+    def test_validate_transactions_batch(self, session: Session, persistent_user: UserModel):
+        """Test bulk validation returns persistable normalized models."""
+        rows = [
+            {
+                "user_id": persistent_user.id,
+                "amount": f"-{i + 1}0.00",
+                "currency": "uah",
+                "description": f" Purchase {i} ",
+                "category": "NEEDS",
+                "transaction_type": "EXPENSE",
+                "source": "MONOBANK",
+                "mono_transaction_id": f"mono_{i}"
+            }
+            for i in range(3)
+        ]
+        
+        transactions = validate_transactions(rows)
+        session.add_all(transactions)
+        session.flush()
+        
+        assert [t.description for t in transactions] == ["Purchase 0", "Purchase 1", "Purchase 2"]
+        assert all(t.currency == "UAH" and t.id is not None for t in transactions)
+    
+    def test_transaction_read_from_model(self, session: Session, persistent_user: UserModel):
+        """Test TransactionRead is built from a loaded row and is immutable."""
+        transaction = TransactionModel(
+            user_id=persistent_user.id,
+            amount=Decimal("-42.00"),
+            description="Books",
+            category=BudgetCategoryEnum.WANTS,
+            transaction_type=TransactionTypeEnum.EXPENSE
+        )
+        session.add(transaction)
+        session.flush()
+        
+        read = TransactionRead.model_validate(transaction)
+        
+        assert read.id == transaction.id
+        assert read.amount == Decimal("-42.00")
+        assert read.category is BudgetCategoryEnum.WANTS
+        assert read.source is TransactionSourceEnum.MANUAL
+        with pytest.raises(ValidationError):
+            read.amount = Decimal("1.00")
+    
+    def test_loaded_currency_values_are_interned(self, session: Session, persistent_user: UserModel):
+        """Test repeated currency values share one string object after load."""
+        for i in range(2):
+            session.add(TransactionModel(
+                user_id=persistent_user.id,
+                amount=Decimal("-5.00"),
+                currency="".join(["U", "A", "H"]),  # fresh, non-interned str
+                description=f"Coffee {i}",
+                category=BudgetCategoryEnum.WANTS,
+                transaction_type=TransactionTypeEnum.EXPENSE
+            ))
+        session.flush()
+        session.expire_all()
+        
+        first, second = session.exec(select(TransactionModel)).all()
+        
+        assert first.currency == "UAH"
+        assert first.currency is second.currency
+        assert first.category is second.category
+    
+    def test_loaded_enum_columns_are_enum_members(self, session: Session, persistent_user: UserModel, bulk_create_transactions):
+        """Test enum columns stored as plain strings load back as enum members."""
+        bulk_create_transactions(persistent_user.id, 1)
+        
+        loaded = session.exec(select(TransactionModel)).one()
+        
+        assert loaded.category is BudgetCategoryEnum.NEEDS
+        assert loaded.transaction_type is TransactionTypeEnum.EXPENSE
+        assert loaded.source is TransactionSourceEnum.MANUAL
+
+
+class TestTransactionValidation:
+    """Test TransactionModel validators and defaults (no database)."""
+    
+    def test_zero_amount_raises_validation_error(self):
+        """Test that amount cannot be zero."""
+        with pytest.raises(ValidationError, match="Amount cannot be zero"):
+            TransactionModel(
+                user_id=1,
+                amount=Decimal("0"),
+                description="Test",
+                category=BudgetCategoryEnum.NEEDS,
+                transaction_type=TransactionTypeEnum.EXPENSE
+            )
+    
+    def test_empty_description_raises_validation_error(self):
+        """Test that description cannot be empty."""
+        with pytest.raises(ValidationError, match="Description cannot be empty"):
+            TransactionModel(
+                user_id=1,
+                amount=Decimal("-50.00"),
+                description="",
+                category=BudgetCategoryEnum.NEEDS,
+                transaction_type=TransactionTypeEnum.EXPENSE
+            )
+    
+    def test_whitespace_description_raises_validation_error(self):
+        """Test that whitespace-only description is invalid."""
+        with pytest.raises(ValidationError, match="Description cannot be empty"):
+            TransactionModel(
+                user_id=1,
+                amount=Decimal("-50.00"),
+                description="   ",
+                category=BudgetCategoryEnum.NEEDS,
+                transaction_type=TransactionTypeEnum.EXPENSE
+            )
+    
+    def test_description_strips_whitespace(self):
+        """Test that description whitespace is stripped."""
+        transaction = TransactionModel(
+            user_id=1,
+            amount=Decimal("-50.00"),
+            description="  Groceries  ",
+            category=BudgetCategoryEnum.NEEDS,
+            transaction_type=TransactionTypeEnum.EXPENSE
+        )
         
-        with pytest.raises(Exception):  # IntegrityError
-            session.commit()
+        assert transaction.description == "Groceries"
+    
+    @pytest.mark.parametrize("field, kwargs, expected", [
+        ("currency", {"currency": "uah"}, "UAH"),
+        ("currency", {}, "UAH"),
+        ("source", {}, TransactionSourceEnum.MANUAL),
+        ("is_ai_categorized", {}, False),
+    ], ids=["currency_uppercased", "default_currency", "default_source", "default_is_ai_categorized"])
+    def test_field_defaults_and_normalization(self, field, kwargs, expected):
+        """Test field defaults and currency normalization."""
+        transaction = TransactionModel(**_BASE_TRANSACTION, **kwargs)
+        
+        assert getattr(transaction, field) == expected
     
     def test_transaction_repr(self):
         """Test __repr__ method."""
@@ -298,3 +323,69 @@ class TestTransactionModel:
         assert "-100.50" in repr_str
         assert "UAH" in repr_str
         assert "Groceries" in repr_str
+    
+    def test_repr_accepts_non_decimal_amount(self):
+        """Test __repr__ does not assume the amount was coerced to Decimal."""
+        transaction = TransactionModel(**{**_BASE_TRANSACTION, "amount": 100})
+        
+        assert "+100 UAH" in repr(transaction)
+    
+    def test_model_validate_normalizes_fields(self):
+        """Test model_validate strips description and uppercases currency."""
+        transaction = TransactionModel.model_validate({
+            "user_id": 1,
+            "amount": "-75.00",
+            "currency": "usd",
+            "description": "  Coffee  ",
+            "category": "WANTS",
+            "transaction_type": "EXPENSE"
+        })
+        
+        assert transaction.description == "Coffee"
+        assert transaction.currency == "USD"
+    
+    def test_model_validate_rejects_future_date(self):
+        """Test transactions dated in the future are rejected."""
+        with pytest.raises(ValidationError, match="Transaction date cannot be in the future"):
+            TransactionModel.model_validate({
+                "user_id": 1,
+                "amount": "-75.00",
+                "description": "Coffee",
+                "category": "WANTS",
+                "transaction_type": "EXPENSE",
+                "created_at": datetime.now(timezone.utc) + timedelta(days=1)
+            })
+    
+    def test_model_validate_accepts_current_time(self):
+        """Test a timestamp taken right now is not treated as future."""
+        transaction = TransactionModel.model_validate({
+            "user_id": 1,
+            "amount": "-75.00",
+            "description": "Coffee",
+            "category": "WANTS",
+            "transaction_type": "EXPENSE",
+            "created_at": datetime.now(timezone.utc)
+        })
+        
+        assert transaction.created_at <= datetime.now(timezone.utc)
+    
+    def test_default_created_at_follows_the_clock(self):
+        """Test created_at defaults to the real time, not the cached "now"."""
+        TransactionModel.model_validate({**_BASE_TRANSACTION})  # warms the cached "now"
+        before = datetime.now(timezone.utc)
+        
+        transaction = TransactionModel.model_validate({**_BASE_TRANSACTION})
+        
+        assert transaction.created_at >= before
+    
+    def test_validate_transactions_rejects_bad_row(self):
+        """Test one invalid row fails the whole batch."""
+        rows = [
+            {"user_id": 1, "amount": "-10.00", "description": "Ok",
+             "category": "NEEDS", "transaction_type": "EXPENSE"},
+            {"user_id": 1, "amount": "0", "description": "Zero",
+             "category": "NEEDS", "transaction_type": "EXPENSE"},
+        ]
+        
+        with pytest.raises(ValidationError, match="Amount cannot be zero"):
+            validate_transactions(rows)
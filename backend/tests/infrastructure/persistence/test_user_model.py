@@ -4,25 +4,34 @@ Tests database operations and Pydantic validation.
 """
 import pytest
 from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlalchemy.exc import IntegrityError
 from pydantic import ValidationError
 
 from app.infrastructure.persistence.user_model import UserModel, TrackingModeEnum
 
 
+# Lookup by email, built once at import; bind "email" per call
+_SELECT_USER_BY_EMAIL = select(UserModel).where(UserModel.email == bindparam("email"))
+
+# Minimal user; field tests add single overrides
+_BASE_USER = dict(email="test@example.com")
+
+
+@pytest.mark.db
 class TestUserModel:
-    """Test UserModel database operations and validation."""
+    """Test UserModel database operations and constraints."""
     
-    def test_create_user_in_database(self, session: Session):
+    def test_create_user_in_database(self, session: Session, valid_password_hash: str):
         """Test creating a user and persisting to database."""
         user = UserModel(
             email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50,  # Valid bcrypt hash format
+            password_hash=valid_password_hash,
             tracking_mode=TrackingModeEnum.MANUAL
         )
         
         session.add(user)
-        session.commit()
-        session.refresh(user)
+        session.flush()
         
         assert user.id is not None
         assert user.email == "test@example.com"
@@ -31,57 +40,129 @@ class TestUserModel:
         assert user.created_at is not None
         assert user.updated_at is not None
     
-    def test_email_uniqueness_constraint(self, session: Session):
+    def test_email_uniqueness_constraint(self, session: Session, valid_password_hash: str):
         """Test that email must be unique."""
         user1 = UserModel(
             email="unique@example.com",
-            password_hash="$2b$12$" + "x" * 50
+            password_hash=valid_password_hash
         )
         session.add(user1)
-        session.commit()
+        session.flush()
         
         # Attempt to create another user with same email
         user2 = UserModel(
             email="unique@example.com",
-            password_hash="$2b$12$" + "y" * 50
+            password_hash=valid_password_hash
         )
-        session.add(user2)
-        
-        with pytest.raises(Exception):  # SQLAlchemy IntegrityError
-            session.commit()
+        with pytest.raises(IntegrityError), session.begin_nested():
+            session.add(user2)
+            session.flush()
     
-    def test_email_lowercase_validator(self):
-        """Test that email is normalized to lowercase."""
+    def test_query_user_by_email(self, session: Session, valid_password_hash: str):
+        """Test querying user by email."""
         user = UserModel(
-            email="Test@EXAMPLE.COM",
-            password_hash="$2b$12$" + "x" * 50
+            email="findme@example.com",
+            password_hash=valid_password_hash
         )
+        session.add(user)
+        session.flush()
         
-        assert user.email == "test@example.com"
+        # Query by email
+        found_user = session.exec(_SELECT_USER_BY_EMAIL, params={"email": "findme@example.com"}).first()
+        
+        assert found_user is not None
+        assert found_user.email == "findme@example.com"
     
-    def test_email_strip_whitespace(self):
-        """Test that email whitespace is stripped."""
+    def test_loaded_tracking_mode_is_enum_member(self, session: Session, valid_password_hash: str):
+        """Test tracking_mode loads back as a TrackingModeEnum member."""
+        session.add(UserModel(
+            email="mode@example.com",
+            password_hash=valid_password_hash,
+            tracking_mode=TrackingModeEnum.AUTO_MONO
+        ))
+        session.flush()
+        session.expire_all()
+        
+        found_user = session.exec(_SELECT_USER_BY_EMAIL, params={"email": "mode@example.com"}).one()
+        
+        assert found_user.tracking_mode is TrackingModeEnum.AUTO_MONO
+    
+    def test_from_orm_trusted_skips_validation(self, session: Session, valid_password_hash: str):
+        """Test re-hydrating a DB row does not re-run validators."""
         user = UserModel(
-            email="  test@example.com  ",
-            password_hash="$2b$12$" + "x" * 50
+            email="trusted@example.com",
+            password_hash=valid_password_hash
         )
+        session.add(user)
+        session.flush()
         
-        assert user.email == "test@example.com"
+        row = session.connection().execute(
+            select(UserModel.__table__).where(UserModel.email == "trusted@example.com")
+        ).one()
+        loaded = UserModel.from_orm_trusted(row)
+        
+        assert loaded.id == user.id
+        assert loaded.email == "trusted@example.com"
+        assert loaded.tracking_mode == TrackingModeEnum.MANUAL
+        
+        # Short hash would fail model_validate, but trusted loads skip it
+        legacy = UserModel.from_orm_trusted(
+            {"email": "legacy@example.com", "password_hash": "$2b$12$short"}
+        )
+        session.add(legacy)
+        session.flush()
+        assert legacy.id is not None
+    
+    def test_from_orm_trusted_row_attaches_for_update(self, session: Session, valid_password_hash: str):
+        """Test a re-hydrated row is persistent once attached: changes flush as an UPDATE."""
+        user = UserModel(email="attach@example.com", password_hash=valid_password_hash)
+        session.add(user)
+        session.flush()
+        session.expunge(user)
+        
+        row = session.connection().execute(
+            select(UserModel.__table__).where(UserModel.id == user.id)
+        ).one()
+        loaded = UserModel.from_orm_trusted(row)
+        session.add(loaded)
+        loaded.is_premium = True
+        session.flush()
+        
+        stored = session.connection().execute(
+            select(UserModel.__table__.c.is_premium).where(UserModel.id == user.id)
+        ).scalar_one()
+        assert stored is True
+        assert session.exec(select(UserModel).where(UserModel.email == "attach@example.com")).one() is loaded
+
+
+class TestUserValidation:
+    """Test UserModel validators and defaults (no database)."""
     
-    def test_invalid_email_raises_validation_error(self):
+    @pytest.mark.parametrize("field, kwargs, expected", [
+        ("email", {"email": "Test@EXAMPLE.COM"}, "test@example.com"),
+        ("email", {"email": "  test@example.com  "}, "test@example.com"),
+        ("tracking_mode", {}, TrackingModeEnum.MANUAL),
+    ], ids=["email_lowercased", "email_stripped", "default_tracking_mode"])
+    def test_field_defaults_and_normalization(self, field, kwargs, expected, valid_password_hash: str):
+        """Test email normalization and field defaults."""
+        user = UserModel(**{**_BASE_USER, "password_hash": valid_password_hash, **kwargs})
+        
+        assert getattr(user, field) == expected
+    
+    def test_invalid_email_raises_validation_error(self, valid_password_hash: str):
         """Test that invalid email format is rejected."""
         with pytest.raises(ValidationError):
             UserModel(
                 email="not-an-email",
-                password_hash="$2b$12$" + "x" * 50
+                password_hash=valid_password_hash
             )
     
-    def test_empty_email_raises_validation_error(self):
+    def test_empty_email_raises_validation_error(self, valid_password_hash: str):
         """Test that empty email is rejected."""
         with pytest.raises(ValidationError):
             UserModel(
                 email="",
-                password_hash="$2b$12$" + "x" * 50
+                password_hash=valid_password_hash
             )
     
     def test_short_password_hash_raises_validation_error(self):
@@ -100,72 +181,72 @@ class TestUserModel:
                 password_hash=""
             )
     
-    def test_tracking_mode_enum_validation(self):
+    def test_tracking_mode_enum_validation(self, valid_password_hash: str):
         """Test that tracking_mode accepts valid enum values."""
         user = UserModel(
             email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50,
+            password_hash=valid_password_hash,
             tracking_mode=TrackingModeEnum.AUTO_MONO
         )
         
         assert user.tracking_mode == TrackingModeEnum.AUTO_MONO
     
-    def test_default_tracking_mode_is_manual(self):
-        """Test that default tracking mode is MANUAL."""
-        user = UserModel(
-            email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        
-        assert user.tracking_mode == TrackingModeEnum.MANUAL
-    
-    def test_empty_mono_token_raises_validation_error(self):
+    def test_empty_mono_token_raises_validation_error(self, valid_password_hash: str):
         """Test that empty string mono_token is rejected."""
         with pytest.raises(ValidationError, match="cannot be empty string"):
             UserModel(
                 email="test@example.com",
-                password_hash="$2b$12$" + "x" * 50,
+                password_hash=valid_password_hash,
                 mono_token=""
             )
     
-    def test_none_mono_token_is_valid(self):
+    def test_none_mono_token_is_valid(self, valid_password_hash: str):
         """Test that None mono_token is valid."""
         user = UserModel(
             email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50,
+            password_hash=valid_password_hash,
             mono_token=None
         )
         
         assert user.mono_token is None
     
-    def test_webhook_hash_alphanumeric_validation(self):
+    def test_webhook_hash_alphanumeric_validation(self, valid_password_hash: str):
         """Test that webhook_hash must be alphanumeric."""
         with pytest.raises(ValidationError, match="must be alphanumeric"):
             UserModel(
                 email="test@example.com",
-                password_hash="$2b$12$" + "x" * 50,
+                password_hash=valid_password_hash,
                 webhook_hash="invalid-hash-with-dash"
             )
     
-    def test_webhook_hash_minimum_length(self):
+    def test_webhook_hash_minimum_length(self, valid_password_hash: str):
         """Test that webhook_hash must be at least 16 characters."""
         with pytest.raises(ValidationError, match="at least 16 characters"):
             UserModel(
                 email="test@example.com",
-                password_hash="$2b$12$" + "x" * 50,
+                password_hash=valid_password_hash,
                 webhook_hash="short"
             )
     
-    def test_valid_webhook_hash(self):
+    def test_valid_webhook_hash(self, valid_password_hash: str):
         """Test that valid webhook_hash is accepted."""
         user = UserModel(
             email="test@example.com",
-            password_hash="$2b$12$" + "x" * 50,
+            password_hash=valid_password_hash,
             webhook_hash="a1b2c3d4e5f6g7h8"
         )
         
         assert user.webhook_hash == "a1b2c3d4e5f6g7h8"
     
+    def test_webhook_hash_rejects_non_ascii(self, valid_password_hash: str):
+        """Test that non-ASCII letters are not accepted as alphanumeric."""
+        with pytest.raises(ValidationError, match="must be alphanumeric"):
+            UserModel.model_validate({
+                "email": "test@example.com",
+                "password_hash": valid_password_hash,
+                "webhook_hash": "абвгдежзийклмноп"
+            })
+    
     def test_user_repr_excludes_sensitive_data(self):
         """Test that __repr__ doesn't expose password hash."""
         user = UserModel(
@@ -177,19 +258,3 @@ class TestUserModel:
         
         assert "test@example.com" in repr_str
         assert "secret_hash" not in repr_str
-    
-    def test_query_user_by_email(self, session: Session):
-        """Test querying user by email."""
-        user = UserModel(
-            email="findme@example.com",
-            password_hash="$2b$12$" + "x" * 50
-        )
-        session.add(user)
-        session.commit()
-        
-        # Query by email
-        statement = select(UserModel).where(UserModel.email == "findme@example.com")
-        found_user = session.exec(statement).first()
-        
-        assert found_user is not None
-        assert found_user.email == "findme@example.com"
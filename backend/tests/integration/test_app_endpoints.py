@@ -0,0 +1,111 @@
+"""
+Integration tests for the static app endpoints.
+"""
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import settings, get_session
+from app.main import app
+from app.infrastructure.persistence import UserModel
+
+
+class TestStaticEndpoints:
+    """Test pre-serialized /health and / responses."""
+    
+    def test_health_check(self, client: TestClient):
+        """Health endpoint returns status and app info as JSON."""
+        response = client.get("/health")
+        
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        body = response.json()
+        assert body["status"] == "healthy"
+        assert body["app_name"] == settings.app_name
+        assert body["database"]["status"] == "connected"
+    
+    def test_root(self, client: TestClient):
+        """Root endpoint returns welcome message."""
+        response = client.get("/")
+        
+        assert response.status_code == 200
+        assert response.json()["health"] == "/health"
+    
+    def test_static_routes_skip_response_model(self):
+        """Static routes return raw bytes: no response_model validation/encoding."""
+        from app.main import app
+        
+        routes = {route.path: route for route in app.routes if route.path in ("/health", "/")}
+        
+        assert len(routes) == 2
+        for route in routes.values():
+            assert route.response_model is None
+
+
+class TestCORS:
+    """Test precomputed CORS headers."""
+    
+    def test_allowed_origin_is_echoed(self, client: TestClient):
+        """Simple request from an allowed origin gets CORS headers."""
+        origin = settings.cors_origins[0]
+        response = client.get("/health", headers={"Origin": origin})
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+    
+    def test_unknown_origin_gets_no_cors_headers(self, client: TestClient):
+        """Request from an unknown origin is served without CORS headers."""
+        response = client.get("/health", headers={"Origin": "https://evil.example"})
+        
+        assert response.status_code == 200
+        assert "access-control-allow-origin" not in response.headers
+    
+    def test_preflight_allowed_origin(self, client: TestClient):
+        """Preflight is answered by the middleware, echoing requested headers."""
+        origin = settings.cors_origins[0]
+        response = client.options("/health", headers={
+            "Origin": origin,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "authorization, content-type"
+        })
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+        assert "POST" in response.headers["access-control-allow-methods"]
+        assert response.headers["access-control-allow-headers"] == "authorization, content-type"
+    
+    def test_preflight_disallowed_origin(self, client: TestClient):
+        """Preflight from an unknown origin is rejected."""
+        response = client.options("/health", headers={
+            "Origin": "https://evil.example",
+            "Access-Control-Request-Method": "GET"
+        })
+        
+        assert response.status_code == 400
+        assert "access-control-allow-origin" not in response.headers
+
+
+class TestSessionOverride:
+    """Test the client fixture's get_session override."""
+    
+    def test_endpoints_get_async_session_on_test_database(
+        self, client: TestClient, session: Session, user: UserModel
+    ):
+        """Test an endpoint awaiting session.exec sees the test session's rows."""
+        probe = FastAPI()
+        probe.dependency_overrides = app.dependency_overrides
+        
+        @probe.get("/emails")
+        async def emails(db: AsyncSession = Depends(get_session)):
+            assert isinstance(db, AsyncSession)
+            result = await db.exec(select(UserModel.email))
+            return result.all()
+        
+        with TestClient(probe) as probe_client:
+            response = probe_client.get("/emails")
+        
+        assert response.status_code == 200
+        assert response.json() == [user.email]
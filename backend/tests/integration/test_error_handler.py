@@ -0,0 +1,75 @@
+"""
+Integration tests for the ASGI error handling middleware.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core import AppException, NotFoundException, settings
+from app.presentation.api.middleware import ExceptionASGIMiddleware
+
+
+@pytest.fixture(name="error_client")
+def error_client_fixture():
+    """Test client for a small app whose routes raise."""
+    test_app = FastAPI()
+    test_app.add_middleware(ExceptionASGIMiddleware)
+    
+    @test_app.get("/missing")
+    async def missing():
+        raise NotFoundException("Budget not found", details={"budget_id": 7})
+    
+    @test_app.get("/boom")
+    async def boom():
+        raise RuntimeError("kaboom")
+    
+    @test_app.get("/ok")
+    async def ok():
+        return {"status": "ok"}
+    
+    with TestClient(test_app) as client:
+        yield client
+
+
+class TestExceptionASGIMiddleware:
+    """Test error responses produced by ExceptionASGIMiddleware."""
+    
+    def test_app_exception_returns_json_error(self, error_client: TestClient):
+        """AppException maps to its status code and JSON body."""
+        response = error_client.get("/missing")
+        
+        assert response.status_code == 404
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {
+            "error": "Budget not found",
+            "details": {"budget_id": 7},
+            "path": "/missing"
+        }
+    
+    def test_unexpected_exception_returns_500(self, error_client: TestClient, monkeypatch):
+        """Unexpected errors return a generic 500 without leaking details."""
+        monkeypatch.setattr(settings, "debug", False)
+        
+        response = error_client.get("/boom")
+        
+        assert response.status_code == 500
+        assert response.json() == {
+            "error": "Internal server error",
+            "details": {},
+            "path": "/boom"
+        }
+    
+    def test_successful_response_passes_through(self, error_client: TestClient):
+        """Normal responses are not touched."""
+        response = error_client.get("/ok")
+        
+        assert response.status_code == 200
+        assert response.json() == {"status": "ok"}
+
+    
+    def test_app_registers_no_exception_handlers(self):
+        """Errors are handled by the middleware alone (no per-type handler dispatch)."""
+        from app.main import app
+        
+        assert AppException not in app.exception_handlers
+        assert Exception not in app.exception_handlers